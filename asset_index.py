@@ -0,0 +1,158 @@
+'''
+AssetIndex Class - Manifest of portrait files, scanned once and refreshed when the directory changes
+
+Replaces probing each idol's .png/.jpg/.jpeg (and default.*) with os.path.exists:
+the images directory is listed once into a name -> AssetEntry map, and later
+lookups only stat the directory to see whether its mtime moved. The manifest
+can be persisted so content hashes survive restarts and are recomputed only
+for files whose mtime or size changed.
+
+Overwriting a portrait in place does not change the directory's mtime, so
+the index keeps the old hash until the directory is touched (or a file is
+added, removed or renamed in it). Run `touch images` after replacing one.
+'''
+
+import json
+import os
+import threading
+from typing import NamedTuple
+
+from save_manager import atomic_write
+from thumbnail_cache import file_digest, IMAGE_EXTENSIONS
+from config import IMAGES_DIR, ASSET_INDEX_FILE
+
+DEFAULT_ASSET = "default"
+
+
+class AssetEntry(NamedTuple):
+    '''One portrait file in the images directory.'''
+    path: str
+    format: str
+    bytes: int
+    mtime_ns: int
+    sha256: str
+
+
+class AssetIndex:
+    '''
+    Maps lower-case idol names to their portrait files.
+
+    When several formats exist for one name, the first in IMAGE_EXTENSIONS
+    wins (.png, then .jpg, then .jpeg), matching the old probing order.
+    '''
+
+    def __init__(self, images_dir: str = IMAGES_DIR, persist_path: str | None = ASSET_INDEX_FILE) -> None:
+        '''
+        Loads the persisted manifest if present, then scans the directory if it changed.
+
+        Parameters:
+            images_dir (str): Directory of portraits. Defaults to config value.
+            persist_path (str | None): Where to keep the manifest between runs; not persisted if None.
+                Defaults to config value.
+        '''
+        self.images_dir = images_dir
+        self.persist_path = persist_path
+        self.dir_mtime_ns = None
+        self.assets = {}
+        self.scans = 0
+        self._lock = threading.Lock()
+
+        if persist_path is not None:
+            try:
+                with open(persist_path, 'r') as f:
+                    data = json.load(f)
+                if data["images_dir"] == images_dir:
+                    self.dir_mtime_ns = data["dir_mtime_ns"]
+                    self.assets = {name: AssetEntry(**fields) for name, fields in data["assets"].items()}
+            except (OSError, ValueError, KeyError, TypeError):
+                pass  # Missing or outdated manifest: the first refresh rescans
+
+        self.refresh()
+
+    def refresh(self) -> bool:
+        '''
+        Rescans the directory if its mtime changed since the last scan.
+
+        Returns:
+            bool: True if a rescan happened.
+        '''
+        try:
+            dir_mtime_ns = os.stat(self.images_dir).st_mtime_ns
+        except OSError:
+            dir_mtime_ns = None
+
+        with self._lock:
+            if dir_mtime_ns is not None and dir_mtime_ns == self.dir_mtime_ns:
+                return False
+
+            self._scan()
+            self.dir_mtime_ns = dir_mtime_ns
+            self.scans += 1
+            self._persist()
+            return True
+
+    def _scan(self) -> None:
+        '''Lists the directory once, re-hashing only files whose mtime or size changed.'''
+        found = {}
+        try:
+            entries = list(os.scandir(self.images_dir))
+        except OSError:
+            entries = []
+
+        for dir_entry in entries:
+            stem, ext = os.path.splitext(dir_entry.name)
+            ext = ext.lower()
+            if ext not in IMAGE_EXTENSIONS or not dir_entry.is_file():
+                continue
+            found.setdefault(stem.lower(), {})[ext] = dir_entry
+
+        assets = {}
+        for name, by_ext in found.items():
+            ext = next(ext for ext in IMAGE_EXTENSIONS if ext in by_ext)
+            dir_entry = by_ext[ext]
+            stat = dir_entry.stat()
+
+            previous = self.assets.get(name)
+            if (previous is not None and previous.path == dir_entry.path
+                    and previous.mtime_ns == stat.st_mtime_ns and previous.bytes == stat.st_size):
+                assets[name] = previous
+                continue
+
+            assets[name] = AssetEntry(dir_entry.path, ext.lstrip("."), stat.st_size, stat.st_mtime_ns,
+                                      file_digest(dir_entry.path))
+
+        self.assets = assets
+
+    def _persist(self) -> None:
+        '''Writes the manifest to persist_path, if one is set.'''
+        if self.persist_path is None:
+            return
+
+        data = {
+            "images_dir": self.images_dir,
+            "dir_mtime_ns": self.dir_mtime_ns,
+            "assets": {name: entry._asdict() for name, entry in self.assets.items()},
+        }
+        try:
+            directory = os.path.dirname(self.persist_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            atomic_write(self.persist_path, json.dumps(data, indent=1, sort_keys=True).encode("utf-8"))
+        except OSError as e:
+            print(f"Could not save asset index: {e}")
+
+    def find(self, idol_name: str) -> AssetEntry | None:
+        '''
+        Returns an idol's portrait, or the default portrait if the idol has none.
+
+        Parameters:
+            idol_name (str): Name of the idol.
+
+        Returns:
+            AssetEntry | None: The portrait file, or None if neither exists.
+        '''
+        self.refresh()
+        entry = self.assets.get(idol_name.lower())
+        if entry is None:
+            entry = self.assets.get(DEFAULT_ASSET)
+        return entry
@@ -0,0 +1,122 @@
+'''
+Binary Save Format - Compact, versioned, fixed-width encoding of player data
+
+Layout (little-endian):
+    header:  magic b"IDOL", format version (u16), coins (i64), total draws (i64), record count (u32),
+             total fans (u64, version 2+)
+    records: idol id (u16), level (u32), fans (u64) - one per owned idol
+
+Idol ids are the dense ids from config.IDOL_IDS, so names and rarities are not
+stored per record. The text format stays readable by Player.load_from_file,
+which detects the format from the magic bytes.
+'''
+
+import struct
+
+from idol_card import IdolCard
+from config import IDOL_IDS, IDOL_ID_NAMES, IDOL_ID_RARITIES
+
+MAGIC = b"IDOL"
+FORMAT_VERSION = 2
+
+PREFIX = struct.Struct("<4sH")
+HEADER_V1 = struct.Struct("<4sHqqI")
+HEADER = struct.Struct("<4sHqqIQ")
+RECORD = struct.Struct("<HIQ")
+
+
+def is_binary_save(data: bytes) -> bool:
+    '''Returns True if the data starts with the binary save magic bytes.'''
+    return data[:len(MAGIC)] == MAGIC
+
+
+def encode_binary_save(coins: int, total_draws: int, idols) -> bytes:
+    '''
+    Packs player data into the binary save format.
+
+    Parameters:
+        coins (int): Coin balance.
+        total_draws (int): Total cards drawn.
+        idols (Iterable[IdolCard]): Owned idols. Every name must be in config.IDOL_IDS.
+
+    Returns:
+        bytes: The encoded save file contents.
+    '''
+    records = bytearray()
+    count = 0
+    total_fans = 0
+    for idol in idols:
+        idol_id = IDOL_IDS.get(idol.name)
+        if idol_id is None:
+            raise ValueError(f"Cannot store unknown idol in binary save: {idol.name}")
+        records += RECORD.pack(idol_id, idol.level, idol.fans)
+        count += 1
+        total_fans += idol.fans
+
+    return HEADER.pack(MAGIC, FORMAT_VERSION, coins, total_draws, count, total_fans) + bytes(records)
+
+
+def _unpack_header(data: bytes) -> tuple[int, int, int, int, int | None]:
+    '''Returns (header size, coins, total draws, record count, total fans or None for version 1).'''
+    if len(data) < PREFIX.size:
+        raise ValueError("Save file corrupted: header too short")
+
+    magic, version = PREFIX.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("Save file corrupted: invalid format")
+    if version == 1:
+        header, total_fans = HEADER_V1, None
+    elif version == FORMAT_VERSION:
+        header = HEADER
+    else:
+        raise ValueError(f"Unsupported save format version: {version}")
+
+    if len(data) < header.size:
+        raise ValueError("Save file corrupted: header too short")
+    fields = header.unpack_from(data)
+    coins, total_draws, count = fields[2:5]
+    if header is HEADER:
+        total_fans = fields[5]
+    return (header.size, coins, total_draws, count, total_fans)
+
+
+def decode_binary_summary(data: bytes) -> tuple[int, int, int, int] | None:
+    '''
+    Reads only the header of a binary save.
+
+    Parameters:
+        data (bytes): At least the first HEADER.size bytes of the save file.
+
+    Returns:
+        tuple[int, int, int, int] | None: Coins, total draws, owned count and total fans,
+            or None for version 1 saves, which have no total fans.
+    '''
+    _, coins, total_draws, count, total_fans = _unpack_header(data)
+    if total_fans is None:
+        return None
+    return (coins, total_draws, count, total_fans)
+
+
+def decode_binary_save(data: bytes) -> tuple[int, int, list[IdolCard]]:
+    '''
+    Unpacks a binary save file in one pass.
+
+    Parameters:
+        data (bytes): The whole save file contents.
+
+    Returns:
+        tuple[int, int, list[IdolCard]]: Coins, total draws, and the owned idols.
+    '''
+    header_size, coins, total_draws, count, _ = _unpack_header(data)
+
+    end = header_size + count * RECORD.size
+    if len(data) < end:
+        raise ValueError("Save file corrupted: insufficient data")
+
+    idols = []
+    for idol_id, level, fans in RECORD.iter_unpack(data[header_size:end]):
+        if idol_id >= len(IDOL_ID_NAMES):
+            raise ValueError(f"Save file corrupted: unknown idol id {idol_id}")
+        idols.append(IdolCard(IDOL_ID_NAMES[idol_id], IDOL_ID_RARITIES[idol_id], level, fans))
+
+    return (coins, total_draws, idols)
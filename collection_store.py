@@ -0,0 +1,188 @@
+'''
+CollectionStore Class - Compact array-backed idol collection keyed by dense idol ids
+'''
+
+from array import array
+
+from idol_card import IdolCard
+from idol_profiles import get_profile_record
+from config import IDOL_ID_NAMES, IDOL_ID_RARITIES, IDOL_IDS, FAN_INCREASE_PER_LEVEL, RARITY_SORT_ORDER
+
+
+class StoredIdolCard(IdolCard):
+    '''
+    A live IdolCard view onto one slot of a CollectionStore.
+
+    Reading or changing level and fans (including level_up) goes straight
+    to the store's arrays, so views never go stale and can be thrown away.
+    '''
+
+    __slots__ = ("_store", "_idol_id")
+
+    def __init__(self, store: "CollectionStore", idol_id: int) -> None:
+        '''
+        Creates a view without copying any gameplay data.
+
+        Parameters:
+            store (CollectionStore): The store that owns the data.
+            idol_id (int): Dense id of the idol in config.IDOL_ID_NAMES.
+        '''
+        self._store = store
+        self._idol_id = idol_id
+        self.name = IDOL_ID_NAMES[idol_id]
+        self.rarity = IDOL_ID_RARITIES[idol_id]
+        self.profile = get_profile_record(self.name)
+
+    @property
+    def level(self) -> int:
+        '''Current level, read from the store.'''
+        return self._store.levels[self._idol_id]
+
+    @level.setter
+    def level(self, value: int) -> None:
+        self._store.levels[self._idol_id] = value
+
+    @property
+    def fans(self) -> int:
+        '''Current fan count, read from the store.'''
+        return self._store.fans[self._idol_id]
+
+    @fans.setter
+    def fans(self, value: int) -> None:
+        self._store.fans[self._idol_id] = value
+
+
+class CollectionStore:
+    '''
+    Struct-of-arrays idol collection with the same mapping interface as a name-to-IdolCard dict.
+
+    Ownership, level and fans live in parallel arrays indexed by the dense ids
+    from config.IDOL_IDS, so a full collection takes a few hundred bytes.
+    IdolCard objects are only materialized as live views when looked up,
+    which lets a Player use this store in place of its collection dict.
+    '''
+
+    def __init__(self) -> None:
+        '''Creates an empty store with one slot per idol in config.IDOL_NAMES.'''
+        size = len(IDOL_ID_NAMES)
+        self.owned = bytearray(size)
+        self.levels = array('I', [0]) * size
+        self.fans = array('Q', [0]) * size
+        self._count = 0
+
+    # Mapping interface (drop-in for Player.collection)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, name: str) -> bool:
+        idol_id = IDOL_IDS.get(name)
+        return idol_id is not None and bool(self.owned[idol_id])
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __getitem__(self, name: str) -> StoredIdolCard:
+        idol = self.get(name)
+        if idol is None:
+            raise KeyError(name)
+        return idol
+
+    def __setitem__(self, name: str, idol: IdolCard) -> None:
+        if name != idol.name:
+            raise ValueError(f"Key {name!r} does not match idol {idol.name!r}")
+        self.add(idol)
+
+    def get(self, name: str, default=None) -> StoredIdolCard | None:
+        '''Returns a live view of an owned idol, or default if it is not owned.'''
+        idol_id = IDOL_IDS.get(name)
+        if idol_id is None or not self.owned[idol_id]:
+            return default
+        return StoredIdolCard(self, idol_id)
+
+    def keys(self) -> list[str]:
+        '''Returns the names of owned idols in id order.'''
+        return [IDOL_ID_NAMES[i] for i in self.owned_ids()]
+
+    def values(self) -> list[StoredIdolCard]:
+        '''Returns live views of all owned idols in id order.'''
+        return [StoredIdolCard(self, i) for i in self.owned_ids()]
+
+    def items(self) -> list[tuple[str, StoredIdolCard]]:
+        '''Returns (name, view) pairs of all owned idols in id order.'''
+        return [(IDOL_ID_NAMES[i], StoredIdolCard(self, i)) for i in self.owned_ids()]
+
+    def clear(self) -> None:
+        '''Removes every idol from the store.'''
+        size = len(self.owned)
+        self.owned = bytearray(size)
+        self.levels = array('I', [0]) * size
+        self.fans = array('Q', [0]) * size
+        self._count = 0
+
+    # Array operations
+
+    def owned_ids(self) -> list[int]:
+        '''Returns the dense ids of all owned idols in ascending order.'''
+        return [i for i, owned in enumerate(self.owned) if owned]
+
+    def add(self, idol: IdolCard) -> None:
+        '''
+        Copies an idol's level and fans into the store.
+
+        Parameters:
+            idol (IdolCard): The idol card to store. Must be in config.IDOL_NAMES.
+        '''
+        idol_id = IDOL_IDS.get(idol.name)
+        if idol_id is None:
+            raise ValueError(f"Unknown idol: {idol.name}")
+
+        if not self.owned[idol_id]:
+            self.owned[idol_id] = 1
+            self._count += 1
+        self.levels[idol_id] = idol.level
+        self.fans[idol_id] = idol.fans
+
+    def level_up(self, name: str, times: int = 1) -> None:
+        '''
+        Levels up an owned idol one or more times in place.
+
+        Parameters:
+            name (str): The idol to level up.
+            times (int): Number of level-ups to apply. Defaults to 1.
+        '''
+        idol_id = IDOL_IDS[name]
+        if not self.owned[idol_id]:
+            raise KeyError(name)
+        self.levels[idol_id] += times
+        self.fans[idol_id] += times * FAN_INCREASE_PER_LEVEL.get(IDOL_ID_RARITIES[idol_id], 100)
+
+    def total_fans(self) -> int:
+        '''Returns the total fan count across all owned idols.'''
+        return sum(self.fans)
+
+    def sorted_ids(self, sort_by: str = "rarity") -> list[int]:
+        '''
+        Returns owned idol ids in display order.
+
+        Parameters:
+            sort_by (str): Sort method - "rarity", "name", or "level". Defaults to "rarity".
+
+        Returns:
+            list[int]: Sorted dense idol ids.
+        '''
+        ids = self.owned_ids()
+
+        if sort_by == "rarity":
+            ids.sort(key=lambda i: (RARITY_SORT_ORDER.get(IDOL_ID_RARITIES[i], 4), IDOL_ID_NAMES[i]))
+        elif sort_by == "name":
+            ids.sort(key=lambda i: IDOL_ID_NAMES[i])
+        elif sort_by == "level":
+            levels = self.levels
+            ids.sort(key=lambda i: (-levels[i], IDOL_ID_NAMES[i]))
+
+        return ids
+
+    def sorted_views(self, sort_by: str = "rarity") -> list[StoredIdolCard]:
+        '''Returns live views of owned idols in display order (see sorted_ids).'''
+        return [StoredIdolCard(self, i) for i in self.sorted_ids(sort_by)]
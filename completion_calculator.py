@@ -0,0 +1,212 @@
+'''
+Completion Calculator - Exact Markov-chain odds for completing the idol collection
+
+Because the gacha always prefers names that have not been drawn yet, a card is
+a new idol exactly when its rarity still has unowned idols. The collection
+state is therefore just the number of owned idols per rarity, and the chance
+of every outcome can be computed by dynamic programming over those states
+instead of sampling millions of players. The pass stops once less than
+DEFAULT_TAIL probability is left, so results are exact to that precision.
+
+Results are memoized per game configuration, so repeated questions about the
+same config are answered from the cache.
+'''
+
+from functools import lru_cache
+
+import config
+from gacha_system import GUARANTEE_RARITIES
+
+# Probability mass left in the tail when the forward pass stops
+DEFAULT_TAIL = 1e-12
+
+# Hard stop for the forward pass, in cards drawn
+MAX_CARDS = 100000
+
+# States lighter than tail * PRUNE_FACTOR are dropped to keep the pass sparse
+PRUNE_FACTOR = 1e-9
+
+
+def _config_key() -> tuple:
+    '''Returns the current game configuration as a hashable memoization key.'''
+    tiers = tuple(config.RARITY_TIERS)
+    return (
+        tiers,
+        tuple(config.RARITY_RATES[r] for r in tiers),
+        tuple(len(config.IDOL_NAMES[r]) for r in tiers),
+        tuple(int(config.SINGLE_DRAW_COST * config.DUPLICATE_REFUND_RATES[r]) for r in tiers),
+        config.SINGLE_DRAW_COST,
+        config.TEN_DRAW_COST,
+    )
+
+
+def _transitions(rates: list[float], sizes: tuple, refunds: tuple) -> list[tuple]:
+    '''
+    Builds the one-card transition table for every collection state.
+
+    States are mixed-radix integers over owned counts per rarity. Draws of a
+    full rarity are merged into one self-loop entry that also carries the
+    expected refund.
+
+    Returns:
+        list[tuple]: Per state, (list of (next_state, probability, rarity_index), expected_refund).
+    '''
+    strides = []
+    stride = 1
+    for size in sizes:
+        strides.append(stride)
+        stride *= size + 1
+
+    table = []
+    for state in range(stride):
+        counts = [(state // strides[r]) % (sizes[r] + 1) for r in range(len(sizes))]
+        moves = []
+        expected_refund = 0.0
+        for r, p in enumerate(rates):
+            if p == 0:
+                continue
+            if counts[r] < sizes[r]:
+                moves.append((state + strides[r], p, r))
+            else:
+                moves.append((state, p, r))
+                expected_refund += p * refunds[r]
+        table.append((moves, expected_refund))
+    return table
+
+
+@lru_cache(maxsize=None)
+def _solve(key: tuple, ten_draw: bool, tail: float) -> tuple[float, float, tuple]:
+    '''
+    Runs the forward pass over collection states for one configuration.
+
+    Returns:
+        tuple[float, float, tuple]: Expected cards drawn, expected net coins spent,
+            and the probability of completing after exactly t cards for each t.
+    '''
+    tiers, rates, sizes, refunds, single_cost, ten_cost = key
+    total = sum(rates)
+    normal = [rate / total for rate in rates]
+
+    # Ten-draw guarantee: the 10th card skips Common if the first 9 had no Rare+
+    rare_plus = {tiers.index(r) for r in GUARANTEE_RARITIES if r in tiers}
+    guarantee_total = sum(rates[r] for r in rare_plus)
+    guarantee = [rates[r] / guarantee_total if r in rare_plus else 0.0 for r in range(len(rates))]
+
+    normal_table = _transitions(normal, sizes, refunds)
+    guarantee_table = _transitions(guarantee, sizes, refunds)
+    complete = len(normal_table) - 1
+
+    # Distribution over (state, saw_rare_plus_this_group); the flag only matters for ten-draws
+    dist = {(0, False): 1.0}
+    pmf = [0.0]
+    expected_coins = 0.0
+    remaining = 1.0
+    cards = 0
+    prune = tail * PRUNE_FACTOR
+
+    while remaining > tail and cards < MAX_CARDS:
+        position = cards % 10 if ten_draw else 0
+
+        # Pay for the draw at the start of each single draw or ten-draw group
+        if not ten_draw:
+            expected_coins += remaining * single_cost
+        elif position == 0:
+            expected_coins += remaining * ten_cost
+
+        new_dist = {}
+        for (state, seen_rare), mass in dist.items():
+            use_guarantee = ten_draw and position == 9 and not seen_rare
+            moves, expected_refund = (guarantee_table if use_guarantee else normal_table)[state]
+            expected_coins -= mass * expected_refund
+            for next_state, p, r in moves:
+                flag = ten_draw and (seen_rare or r in rare_plus)
+                new_dist[(next_state, flag)] = new_dist.get((next_state, flag), 0.0) + mass * p
+        cards += 1
+
+        # Only a handful of states carry real mass late in the pass
+        dist = {}
+        for entry, mass in new_dist.items():
+            if mass > prune:
+                dist[entry] = mass
+            else:
+                remaining -= mass
+
+        # Completion is checked after every single draw, or after a full ten-draw
+        if not ten_draw or cards % 10 == 0:
+            done = dist.pop((complete, False), 0.0) + dist.pop((complete, True), 0.0)
+            pmf.extend([0.0] * (cards - len(pmf) + 1))
+            pmf[cards] = done
+            remaining -= done
+            if ten_draw:
+                # A new ten-draw starts without a Rare+ card
+                reset = {}
+                for (state, _), mass in dist.items():
+                    reset[(state, False)] = reset.get((state, False), 0.0) + mass
+                dist = reset
+
+    expected_cards = sum(t * p for t, p in enumerate(pmf))
+    return (expected_cards, expected_coins, tuple(pmf))
+
+
+def expected_draws(ten_draw: bool = False, tail: float = DEFAULT_TAIL) -> float:
+    '''
+    Returns the expected number of cards drawn to complete a fresh collection.
+
+    Parameters:
+        ten_draw (bool): If True, the player only uses ten-draws. Defaults to False.
+        tail (float): Probability mass allowed to remain when the pass stops.
+
+    Returns:
+        float: Expected cards drawn (ten per ten-draw).
+    '''
+    return _solve(_config_key(), ten_draw, tail)[0]
+
+
+def expected_coins(ten_draw: bool = False, tail: float = DEFAULT_TAIL) -> float:
+    '''
+    Returns the expected net coin cost (draw costs minus duplicate refunds) to complete a collection.
+
+    Parameters:
+        ten_draw (bool): If True, the player only uses ten-draws. Defaults to False.
+        tail (float): Probability mass allowed to remain when the pass stops.
+
+    Returns:
+        float: Expected net coins spent.
+    '''
+    return _solve(_config_key(), ten_draw, tail)[1]
+
+
+def draw_distribution(ten_draw: bool = False, tail: float = DEFAULT_TAIL) -> tuple[float, ...]:
+    '''
+    Returns the full distribution of cards drawn to complete a collection.
+
+    Parameters:
+        ten_draw (bool): If True, the player only uses ten-draws. Defaults to False.
+        tail (float): Probability mass allowed to remain when the pass stops.
+
+    Returns:
+        tuple[float, ...]: Entry t is the probability of completing after exactly t cards.
+    '''
+    return _solve(_config_key(), ten_draw, tail)[2]
+
+
+def draw_percentile(q: float, ten_draw: bool = False, tail: float = DEFAULT_TAIL) -> int:
+    '''
+    Returns the q-th percentile of cards drawn to complete a collection.
+
+    Parameters:
+        q (float): Percentile between 0 and 100.
+        ten_draw (bool): If True, the player only uses ten-draws. Defaults to False.
+        tail (float): Probability mass allowed to remain when the pass stops.
+
+    Returns:
+        int: Smallest card count with at least q% of players complete.
+    '''
+    pmf = draw_distribution(ten_draw, tail)
+    threshold = q / 100
+    cumulative = 0.0
+    for cards, p in enumerate(pmf):
+        cumulative += p
+        if cumulative >= threshold:
+            return cards
+    return len(pmf) - 1
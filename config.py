@@ -28,6 +28,14 @@ RARITY_RATES = {
     "Legendary": 0.02    # 2%
 }
 
+# Dense integer ids for rarities and idols (used by batch draws)
+# Rarity id is the position in RARITY_TIERS, idol id the position in IDOL_ID_NAMES
+RARITY_TIERS = list(RARITY_RATES.keys())
+IDOL_ID_NAMES = [name for rarity in RARITY_TIERS for name in IDOL_NAMES[rarity]]
+IDOL_ID_RARITIES = [rarity for rarity in RARITY_TIERS for name in IDOL_NAMES[rarity]]
+IDOL_IDS = {name: idol_id for idol_id, name in enumerate(IDOL_ID_NAMES)}
+TOTAL_IDOLS = len(IDOL_ID_NAMES)
+
 # Base Fan Counts by Rarity
 BASE_FANS = {
     "Common": 100,
@@ -60,6 +68,9 @@ TEN_DRAW_COST = 100          # Cost per ten-draw (10% discount)
 BANKRUPTCY_BONUS_SINGLE = 50 # Bonus coins for single draw bankruptcy
 BANKRUPTCY_BONUS_TEN = 100   # Bonus coins for ten-draw bankruptcy
 
+# Display order for collection views (Legendary first)
+RARITY_SORT_ORDER = {"Legendary": 0, "Epic": 1, "Rare": 2, "Common": 3}
+
 # Rarity Display Symbols
 RARITY_SYMBOLS = {
     "Common": "⭐",
@@ -70,3 +81,21 @@ RARITY_SYMBOLS = {
 
 # Save File Settings
 SAVE_FILE_NAME = "player_data.txt"
+SAVE_JOURNAL = False         # Auto-save draws as journal records, with a full snapshot on exit
+JOURNAL_SNAPSHOT_EVERY = 50  # Journal records between full snapshots (journal mode only)
+SAVE_BINARY = False          # Write compact binary snapshots instead of text (both load automatically)
+SAVE_COALESCE_SECONDS = 2.0  # Auto-save requests within this window share one write
+SAVE_COALESCE_MAX = 10       # Pending auto-save requests that force an immediate write
+SQLITE_POOL_SIZE = 4         # Pooled connections per SQLiteStorage (multi-player backend)
+SAVE_SHARD_COUNT = 4096      # Shard files in a multi-player save directory (sharded_store)
+
+# Portrait Settings
+IMAGES_DIR = "images"
+THUMBNAIL_DIR = ".thumbnails"            # Pre-rendered portraits (see thumbnail_cache.py)
+# Persisted manifest of portrait files (see asset_index.py)
+ASSET_INDEX_FILE = ".thumbnails/assets.json"
+# Portrait boxes shown by the GUI: draw results, then profile details
+PORTRAIT_SIZES = [(150, 150), (250, 250)]
+PORTRAIT_CACHE_BYTES = 16 * 1024 * 1024  # Memory budget for decoded portraits kept by the GUI
+PORTRAIT_RESAMPLE = "high"               # Portrait resize quality: "fast", "balanced" or "high" (see portraits.py)
+PORTRAIT_DECODE_WORKERS = 2              # Background threads decoding and prefetching portraits
@@ -0,0 +1,135 @@
+'''
+DrawJournal Class - Append-only log of draw effects between full save snapshots
+'''
+
+import os
+
+from idol_card import IdolCard
+
+
+class DrawJournal:
+    '''
+    Records each draw's effect as one small line appended to a journal file.
+
+    A record holds the coin balance, the draw count, and the current state of
+    every idol the draw added or levelled up, so replaying records in order on
+    top of the last snapshot restores the game (and replaying one twice is
+    harmless). Player.save_to_file writes a full snapshot and truncates the
+    journal every snapshot_every records.
+    '''
+
+    def __init__(self, save_file: str, snapshot_every: int = 50) -> None:
+        '''
+        Initialises a journal for one save file.
+
+        Parameters:
+            save_file (str): The snapshot file this journal belongs to.
+            snapshot_every (int): Records to append before a full snapshot is due. Defaults to 50.
+        '''
+        self.save_file = save_file
+        self.path = journal_path(save_file)
+        self.snapshot_every = snapshot_every
+        self.changed_names = set()
+        self._file = None
+
+        # Records already in the file still count towards the next snapshot
+        self.records = 0
+        if os.path.exists(self.path):
+            with open(self.path, 'r') as f:
+                self.records = sum(1 for _ in f)
+
+    def mark_changed(self, name: str) -> None:
+        '''Notes that an idol was added or levelled up since the last record.'''
+        self.changed_names.add(name)
+
+    def snapshot_due(self) -> bool:
+        '''Returns True when the next save should be a full snapshot instead of a record.'''
+        return self.records >= self.snapshot_every or not os.path.exists(self.save_file)
+
+    def append(self, player) -> None:
+        '''
+        Appends one record with the player's coins, draws and changed idols.
+
+        Parameters:
+            player (Player): The player whose changes are recorded.
+        '''
+        fields = [f"{player.coins},{player.total_draws}"]
+        for name in self.changed_names:
+            idol = player.collection.get(name)
+            if idol:
+                fields.append(f"{idol.name},{idol.rarity},{idol.level},{idol.fans}")
+
+        if self._file is None:
+            self._file = open(self.path, 'a')
+        self._file.write("|".join(fields) + "\n")
+        self._file.flush()
+
+        self.records += 1
+        self.changed_names.clear()
+
+    def reset(self) -> None:
+        '''Empties the journal after a full snapshot has been written.'''
+        self.close()
+        open(self.path, 'w').close()
+        self.records = 0
+        self.changed_names.clear()
+
+    def close(self) -> None:
+        '''Closes the journal file handle if it is open.'''
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def journal_path(save_file: str) -> str:
+    '''Returns the journal file path that belongs to a save file.'''
+    return f"{save_file}.journal"
+
+
+def replay_journal(player, save_file: str) -> int:
+    '''
+    Applies every complete journal record for a save file to a loaded player.
+
+    Records that cannot be parsed (e.g. a line cut short by a crash) are skipped,
+    as are records no newer than the snapshot: a crash between writing a snapshot
+    and truncating the journal leaves older records behind, and total draws only
+    ever increase.
+
+    Parameters:
+        player (Player): Player already loaded from the snapshot.
+        save_file (str): The snapshot file whose journal should be replayed.
+
+    Returns:
+        int: Number of records applied.
+    '''
+    path = journal_path(save_file)
+    if not os.path.exists(path):
+        return 0
+
+    snapshot_draws = player.total_draws
+    applied = 0
+    with open(path, 'r') as f:
+        for line in f:
+            if not line.endswith("\n"):  # Partially written final record
+                continue
+
+            fields = line.strip().split("|")
+            try:
+                coins, draws = (int(value) for value in fields[0].split(","))
+                idols = []
+                for field in fields[1:]:
+                    name, rarity, level, fans = field.split(",")
+                    idols.append(IdolCard(name, rarity, int(level), int(fans)))
+            except ValueError:
+                continue
+
+            if draws <= snapshot_draws:  # Already contained in the snapshot
+                continue
+
+            player.coins = coins
+            player.total_draws = draws
+            for idol in idols:
+                player.collection[idol.name] = idol
+            applied += 1
+
+    return applied
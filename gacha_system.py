@@ -3,8 +3,19 @@ GachaSystem Class - Manages idol card draws and randomised card creation
 '''
 
 import random
+from array import array
 from idol_card import IdolCard
-from config import IDOL_NAMES, RARITY_RATES
+from rarity_sampler import RaritySampler
+from config import IDOL_NAMES, RARITY_RATES, RARITY_TIERS, IDOL_IDS
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Rarities allowed on the guaranteed 10th card of a ten-draw
+GUARANTEE_RARITIES = ["Rare", "Epic", "Legendary"]
 
 
 class GachaSystem:
@@ -12,18 +23,45 @@ class GachaSystem:
     Manages the gacha draw system with rarity rates and idol generation.
     
     Creates idol cards using probability rates and tracks drawn idols
-    to avoid duplicate names in the collection.
+    to avoid duplicate names in the collection. Every draw comes from the
+    system's own random generator, so seeded systems replay exactly.
+    
+    The roster, rates, name -> rarity map and rarity samplers are static
+    config data, so they are built once here and shared by every instance;
+    each instance only keeps its RNG and the pools of names not yet drawn.
     '''
     
-    def __init__(self) -> None:
+    idol_names = IDOL_NAMES
+    rarity_rates = RARITY_RATES
+    _rarity_of = {name: rarity for rarity, names in IDOL_NAMES.items() for name in names}
+    
+    # Normal draws use every rarity; the guarantee excludes Common
+    sampler = RaritySampler(RARITY_RATES)
+    guarantee_sampler = RaritySampler({rarity: RARITY_RATES[rarity] for rarity in GUARANTEE_RARITIES})
+    
+    def __init__(self, rng: random.Random | None = None) -> None:
         '''
         Initialises the gacha system with idol names and rarity rates.
         
-        Sets up the idol name pool, rarity probability rates, and used names tracker.
+        Sets up the pools of names not yet drawn (every name, for a new system).
+        The shared rarity samplers make each draw a single table lookup.
+        
+        Parameters:
+            rng (random.Random | None): Generator for all draws, e.g. from rng_streams.spawn_rng.
+                Creates an independently seeded generator if None.
         '''
-        self.idol_names = IDOL_NAMES
-        self.rarity_rates = RARITY_RATES
-        self.used_names = set()
+        self.rng = rng if rng is not None else random.Random()
+        
+        # Per-rarity pools of names not yet drawn; used_names is derived from them.
+        # Each name's position is indexed so it can be swap-removed in O(1).
+        self.remaining_names = {}
+        self._remaining_index = {}
+        self._rebuild_remaining(())
+    
+    @property
+    def used_names(self) -> set[str]:
+        '''Roster names already drawn, i.e. those missing from the remaining pools.'''
+        return {name for name in self._rarity_of if name not in self._remaining_index}
     
     def generate_card(self, guarantee_rare: bool = False) -> IdolCard:
         '''
@@ -38,41 +76,176 @@ class GachaSystem:
         # Determine rarity based on guarantee flag
         if guarantee_rare:
             # Guarantee mechanic: exclude Common to ensure at least Rare rarity
-            rarities = ["Rare", "Epic", "Legendary"]
-            weights = [
-                self.rarity_rates["Rare"], 
-                self.rarity_rates["Epic"], 
-                self.rarity_rates["Legendary"]
-            ]
-            # Normalise weights to sum to 1.0
-            total = sum(weights)
-            weights = [w/total for w in weights]
-            rarity = random.choices(rarities, weights=weights)[0]
+            rarity = self.guarantee_sampler.sample(self.rng)
         else:
             # Normal draw with all rarities included
-            rarities = list(self.rarity_rates.keys())
-            weights = list(self.rarity_rates.values())
-            rarity = random.choices(rarities, weights=weights)[0]
+            rarity = self.sampler.sample(self.rng)
         
-        # Select a random name from the rarity pool
-        available_names = [
-            name for name in self.idol_names[rarity] 
-            if name not in self.used_names  # Filter out already used names
-        ]
+        # Select a random name from the names of this rarity not drawn yet
+        available_names = self.remaining_names[rarity]
         
         # If all names used, allow repeats
         if not available_names:
             available_names = self.idol_names[rarity]
         
-        name = random.choice(available_names)
-        self.used_names.add(name)
+        name = self.rng.choice(available_names)
+        self.mark_used(name)
         
         return IdolCard(name, rarity)
     
+    def generate_cards(self, n: int, ten_draw: bool = False) -> tuple:
+        '''
+        Generates many idol draws at once as compact id arrays.
+        
+        Follows the same rules as generate_card: rarities use the configured rates,
+        unused names are preferred until a rarity pool is exhausted, and every
+        name drawn is removed from the remaining pools. No IdolCard objects are created.
+        Uses NumPy when installed and falls back to the standard library otherwise.
+        
+        Parameters:
+            n (int): Number of cards to draw.
+            ten_draw (bool): If True, cards are drawn in groups of ten and the 10th card
+                of each group is guaranteed Rare+ when the first 9 are all Common.
+                n must then be a multiple of 10. Defaults to False.
+        
+        Returns:
+            tuple: (rarity_ids, idol_ids) arrays of length n, indexing into
+                config.RARITY_TIERS and config.IDOL_ID_NAMES respectively.
+        '''
+        if n < 0:
+            raise ValueError("Number of draws cannot be negative")
+        if ten_draw and n % 10 != 0:
+            raise ValueError("Ten-draw batches need a multiple of 10 cards")
+        
+        if NUMPY_AVAILABLE:
+            return self._generate_cards_numpy(n, ten_draw)
+        return self._generate_cards_python(n, ten_draw)
+    
+    def _generate_cards_numpy(self, n: int, ten_draw: bool) -> tuple:
+        '''Vectorised batch draw backed by NumPy (see generate_cards).'''
+        # Seeded from this system's generator so batches replay exactly too
+        rng = np.random.default_rng(self.rng.getrandbits(64))
+        
+        rarity_ids = self._sample_alias_numpy(self.sampler, rng, n)
+        
+        if ten_draw and n:
+            # Redraw the 10th card of every group whose first 9 cards are all Common
+            groups = rarity_ids.reshape(-1, 10)
+            common_id = RARITY_TIERS.index("Common")
+            needs_guarantee = (groups[:, :9] == common_id).all(axis=1)
+            groups[needs_guarantee, 9] = self._sample_alias_numpy(
+                self.guarantee_sampler, rng, int(needs_guarantee.sum())
+            )
+        
+        idol_ids = np.empty(n, dtype=np.uint16)
+        for rarity_id, rarity in enumerate(RARITY_TIERS):
+            positions = np.flatnonzero(rarity_ids == rarity_id)
+            if not len(positions):
+                continue
+            
+            pool = self.idol_names[rarity]
+            unused = self.remaining_names[rarity]
+            
+            # Unused names come out first in random order, then repeats are allowed
+            fresh = [unused[i] for i in rng.permutation(len(unused))[:len(positions)]]
+            idol_ids[positions[:len(fresh)]] = [IDOL_IDS[name] for name in fresh]
+            
+            pool_ids = np.array([IDOL_IDS[name] for name in pool], dtype=np.uint16)
+            idol_ids[positions[len(fresh):]] = rng.choice(pool_ids, size=len(positions) - len(fresh))
+            
+            for name in fresh:
+                self.mark_used(name)
+        
+        return rarity_ids, idol_ids
+    
+    @staticmethod
+    def _sample_alias_numpy(sampler: RaritySampler, rng, n: int):
+        '''Vectorised alias-table lookup returning rarity ids from config.RARITY_TIERS.'''
+        tier_ids = np.array([RARITY_TIERS.index(r) for r in sampler.outcomes], dtype=np.uint8)
+        probabilities = np.array(sampler.probabilities)
+        aliases = np.array(sampler.aliases)
+        
+        u = rng.random(n) * len(sampler.outcomes)
+        columns = u.astype(np.intp)
+        keep = (u - columns) < probabilities[columns]
+        return tier_ids[np.where(keep, columns, aliases[columns])]
+    
+    def _generate_cards_python(self, n: int, ten_draw: bool) -> tuple:
+        '''Standard library fallback for generate_cards when NumPy is not installed.'''
+        tier_ids = {rarity: rarity_id for rarity_id, rarity in enumerate(RARITY_TIERS)}
+        sample = self.sampler.sample
+        rarity_ids = array('B', [tier_ids[sample(self.rng)] for _ in range(n)])
+        
+        if ten_draw:
+            common_id = tier_ids["Common"]
+            for start in range(0, n, 10):
+                # Redraw the 10th card if the first 9 cards are all Common
+                if all(r == common_id for r in rarity_ids[start:start + 9]):
+                    rarity_ids[start + 9] = tier_ids[self.guarantee_sampler.sample(self.rng)]
+        
+        idol_ids = array('H', bytes(2 * n))
+        for rarity_id, rarity in enumerate(RARITY_TIERS):
+            positions = [i for i, r in enumerate(rarity_ids) if r == rarity_id]
+            if not positions:
+                continue
+            
+            pool = self.idol_names[rarity]
+            unused = self.remaining_names[rarity]
+            
+            # Unused names come out first in random order, then repeats are allowed
+            fresh = self.rng.sample(unused, min(len(unused), len(positions)))
+            repeats = self.rng.choices(pool, k=len(positions) - len(fresh))
+            for position, name in zip(positions, fresh + repeats):
+                idol_ids[position] = IDOL_IDS[name]
+            
+            for name in fresh:
+                self.mark_used(name)
+        
+        return rarity_ids, idol_ids
+    
+    def mark_used(self, name: str) -> None:
+        '''
+        Records an idol name as drawn and removes it from its remaining pool in O(1).
+        
+        Parameters:
+            name (str): The idol name to mark as used.
+        '''
+        position = self._remaining_index.pop(name, None)
+        if position is None:  # Already used or not part of the roster
+            return
+        
+        # Swap-remove: move the last remaining name into the freed slot
+        pool = self.remaining_names[self._rarity_of[name]]
+        last = pool.pop()
+        if last != name:
+            pool[position] = last
+            self._remaining_index[last] = position
+    
+    def set_used_names(self, names) -> None:
+        '''
+        Replaces the used names and rebuilds the remaining pools.
+        
+        Parameters:
+            names (Iterable[str]): Idol names that have already been drawn.
+        '''
+        self._rebuild_remaining(set(names))
+    
     def reset_used_names(self) -> None:
         '''
         Resets the used names tracker.
         
         Clears the set of used idol names. Useful for starting a new game session.
         '''
-        self.used_names.clear()
+        self._rebuild_remaining(())
+    
+    def _rebuild_remaining(self, used_names) -> None:
+        '''Rebuilds the per-rarity remaining pools without the given used names.'''
+        self.remaining_names = {
+            rarity: [name for name in names if name not in used_names]
+            for rarity, names in self.idol_names.items()
+        }
+        self._remaining_index = {
+            name: position
+            for pool in self.remaining_names.values()
+            for position, name in enumerate(pool)
+        }
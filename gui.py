@@ -6,20 +6,36 @@ Simple Tkinter-based graphical interface
 import tkinter as tk
 from tkinter import messagebox
 from typing import TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 import os
+import queue
+import threading
 
 try:
-    from PIL import Image, ImageTk
+    from PIL import ImageTk
     PIL_AVAILABLE = True
 except ImportError:
     PIL_AVAILABLE = False
     print("Warning: PIL not available. Images will not be displayed.")
 
 from player import Player
-from config import RARITY_SYMBOLS
+from draw_journal import journal_path
+from save_manager import SaveManager, SaveWorker
+from portrait_cache import PortraitCache
+from portraits import decode_portrait
+from thumbnail_cache import ThumbnailCache
+from sprite_atlas import SpriteAtlas
+from asset_index import AssetIndex
+from virtual_list import VirtualList
+from config import (
+    RARITY_SYMBOLS, TOTAL_IDOLS, IDOL_ID_NAMES, IMAGES_DIR, PORTRAIT_SIZES, PORTRAIT_DECODE_WORKERS,
+    SAVE_JOURNAL
+)
 
 if TYPE_CHECKING:
     from idol_card import IdolCard
+    from PIL import Image
 
 
 class IdolGameGUI:
@@ -39,10 +55,30 @@ class IdolGameGUI:
         
         # Initialize player
         self.player = Player()
-        is_new = not self.player.load_from_file()
+        is_new = not self.player.load_from_file(lazy=True)  # Collection is read when first needed
+        if SAVE_JOURNAL:
+            self.player.enable_journal()  # Draws append journal records; exit writes a snapshot
         
-        # Images directory (no caching)
-        self.images_dir = "images"
+        # Coalesces auto-saves after rapid draws into one atomic write,
+        # done on a background thread so disk I/O never blocks the mainloop
+        self.save_worker = SaveWorker()
+        self.save_manager = SaveManager(self.player, worker=self.save_worker)
+        self.root.protocol("WM_DELETE_WINDOW", self.save_and_exit)
+        
+        # Images directory, and decoded portraits kept for repeat views
+        self.images_dir = IMAGES_DIR
+        self.asset_index = AssetIndex(self.images_dir)
+        self.portrait_cache = PortraitCache()
+        self.thumbnail_cache = ThumbnailCache(self.images_dir)
+        self.sprite_atlases = {}  # Display size -> mapped SpriteAtlas, or None if not built
+        self.atlas_lock = threading.Lock()
+        
+        # Portraits decode on background threads; PhotoImages are only created on the Tk thread
+        self.decode_pool = ThreadPoolExecutor(max_workers=PORTRAIT_DECODE_WORKERS,
+                                              thread_name_prefix="portrait")
+        self.portrait_jobs = {}  # (idol name, size) -> Future of a decoded PIL image
+        self.portrait_polling = False  # Whether collect_prefetched_portraits is scheduled
+        self.decoded_portraits = queue.Queue()  # Keys of finished jobs, filled by the pool
         
         # Window references to prevent duplicates
         self.collection_window = None
@@ -52,6 +88,7 @@ class IdolGameGUI:
         self.setup_styles()
         self.create_widgets()
         self.update_display()
+        self.root.after_idle(self.prefetch_draw_results)
         
         # Show welcome message
         if is_new:
@@ -63,11 +100,11 @@ class IdolGameGUI:
             )
         else:
             # Welcome back message for returning players
-            collection_count = len(self.player.collection)
+            collection_count = self.player.owned_count
             messagebox.showinfo(
                 "Welcome Back!",
                 f"🌟 Welcome back, Producer!\n\n"
-                f"📚 Collection: {collection_count}/26 idols\n"
+                f"📚 Collection: {collection_count}/{TOTAL_IDOLS} idols\n"
                 f"💰 Coins: {self.player.coins}\n\n"
                 f"✨ Ready to continue your journey?"
             )
@@ -98,42 +135,159 @@ class IdolGameGUI:
         if not PIL_AVAILABLE:
             return None
         
-        # Try to load idol-specific image (support both .png and .jpg)
-        idol_name_lower = idol_name.lower()
-        image_path = None
-        
-        # Try different image formats
-        for ext in ['.png', '.jpg', '.jpeg']:
-            test_path = os.path.join(self.images_dir, f"{idol_name_lower}{ext}")
-            if os.path.exists(test_path):
-                image_path = test_path
-                break
-        
-        # If not found, try default images
-        if image_path is None:
-            for ext in ['.png', '.jpg', '.jpeg']:
-                test_path = os.path.join(self.images_dir, f"default{ext}")
-                if os.path.exists(test_path):
-                    image_path = test_path
-                    break
-        
-        # If still not found, return None
-        if image_path is None:
-            return None
+        size = tuple(size)
+        cache_key = (idol_name, size)
+        photo = self.portrait_cache.get(cache_key)
+        if photo is not None:
+            return photo
         
         try:
-            # Load image
-            img = Image.open(image_path)
-            
-            # Calculate new size maintaining aspect ratio
-            img.thumbnail(size, Image.Resampling.LANCZOS)
+            # A prefetch still queued is cancelled (waiting would also wait for every job
+            # ahead of it); one already decoding is quicker to finish than to start over
+            job = self.portrait_jobs.pop(cache_key, None)
+            if job is not None and not job.cancel():
+                img = job.result()
+            else:
+                img = self.decode_idol_portrait(idol_name, size)
+            if img is None:
+                return None
             
             photo = ImageTk.PhotoImage(img)
+            self.portrait_cache.put(cache_key, photo, photo.width() * photo.height() * 4)
             return photo
         except Exception as e:
             print(f"Error loading image for {idol_name}: {e}")
             return None
     
+    def decode_idol_portrait(self, idol_name: str, size: tuple) -> 'Image.Image | None':
+        '''
+        Find and decode an idol's portrait (safe to call from the decode pool).
+        
+        Parameters:
+            idol_name (str): Name of the idol
+            size (tuple): Max image size (width, height)
+        
+        Returns:
+            Image.Image or None: The decoded portrait or None if no image exists
+        '''
+        # Idol-specific image (.png, .jpg or .jpeg), else the default image
+        asset = self.asset_index.find(idol_name)
+        if asset is None:
+            return None
+        
+        return self.decode_idol_image(asset.path, size, asset.sha256)
+    
+    def prefetch_portraits(self, idol_names, size: tuple) -> None:
+        '''
+        Start decoding portraits in the background so they show instantly later.
+        
+        Only as many portraits as the portrait cache can hold at this size are
+        prefetched, so later ones do not evict earlier ones before they are shown.
+        
+        Parameters:
+            idol_names (Iterable[str]): Idols likely to be shown soon
+            size (tuple): Max image size (width, height)
+        '''
+        if not PIL_AVAILABLE:
+            return
+        
+        size = tuple(size)
+        limit = self.portrait_cache.max_bytes // (size[0] * size[1] * 4)
+        for idol_name in islice(idol_names, limit):
+            cache_key = (idol_name, size)
+            if cache_key in self.portrait_cache or cache_key in self.portrait_jobs:
+                continue
+            job = self.decode_pool.submit(self.decode_idol_portrait, idol_name, size)
+            job.add_done_callback(lambda _, key=cache_key: self.decoded_portraits.put(key))
+            self.portrait_jobs[cache_key] = job
+        
+        self.schedule_portrait_collection()
+    
+    def schedule_portrait_collection(self) -> None:
+        '''Poll for finished background decodes, keeping at most one poll scheduled.'''
+        if self.portrait_jobs and not self.portrait_polling:
+            self.portrait_polling = True
+            self.root.after(50, self.collect_prefetched_portraits)
+    
+    def collect_prefetched_portraits(self) -> None:
+        '''Turn finished background decodes into cached PhotoImages; keeps polling while jobs run.'''
+        self.portrait_polling = False
+        while True:
+            try:
+                cache_key = self.decoded_portraits.get_nowait()
+            except queue.Empty:
+                break
+            
+            job = self.portrait_jobs.pop(cache_key, None)
+            if job is None:  # Already collected by load_idol_image
+                continue
+            try:
+                img = job.result()
+            except Exception as e:
+                print(f"Error loading image for {cache_key[0]}: {e}")
+                continue
+            if img is not None:
+                photo = ImageTk.PhotoImage(img)
+                self.portrait_cache.put(cache_key, photo, photo.width() * photo.height() * 4)
+        
+        self.schedule_portrait_collection()
+    
+    def prefetch_collection(self) -> None:
+        '''Prefetch every owned idol at profile detail size.'''
+        # Called when the profiles window opens rather than at startup, so a lazy
+        # load's collection is only read once a view actually needs it
+        self.prefetch_portraits(self.player.collection.keys(), PORTRAIT_SIZES[1])
+    
+    def prefetch_draw_results(self) -> None:
+        '''Prefetch draw-result portraits in idle time: unowned idols first, then owned ones.'''
+        if self.player.is_loaded:
+            owned = self.player.collection.keys()
+            idol_names = [name for name in IDOL_ID_NAMES if name not in owned] + list(owned)
+        else:
+            idol_names = IDOL_ID_NAMES  # Ownership is unknown until the lazy load is read
+        self.prefetch_portraits(idol_names, PORTRAIT_SIZES[0])
+    
+    def get_sprite_atlas(self, size: tuple) -> SpriteAtlas | None:
+        '''Map the sprite atlas for a display size on first use; None if it has not been built.'''
+        with self.atlas_lock:
+            if size not in self.sprite_atlases:
+                try:
+                    self.sprite_atlases[size] = SpriteAtlas(self.thumbnail_cache.atlas_path(size))
+                except (OSError, ValueError):
+                    self.sprite_atlases[size] = None
+            return self.sprite_atlases[size]
+    
+    def decode_idol_image(self, image_path: str, size: tuple, sha256: str | None = None) -> 'Image.Image':
+        '''
+        Decode a portrait at display size from the fastest up-to-date source.
+        
+        Tries the mapped sprite atlas, then the pre-rendered thumbnail file,
+        then the original image.
+        
+        Parameters:
+            image_path (str): Path of the original portrait
+            size (tuple): Max image size (width, height)
+            sha256 (str | None): Content hash of the original if known (skips a stat)
+        
+        Returns:
+            Image.Image: The portrait, at most size
+        '''
+        digest = self.thumbnail_cache.current_digest(image_path, size, sha256)
+        if digest is not None:
+            atlas = self.get_sprite_atlas(size)
+            if atlas is not None:
+                img = atlas.get(os.path.basename(image_path), digest)
+                if img is not None:
+                    return img
+            
+            try:
+                return decode_portrait(self.thumbnail_cache.thumbnail_path(digest, size), size)
+            except OSError:
+                pass  # Thumbnail deleted since the build; use the original
+        
+        # Decode the original at reduced scale and resize, maintaining aspect ratio
+        return decode_portrait(image_path, size)
+    
     def create_widgets(self) -> None:
         '''Create all GUI widgets.'''
         # Title
@@ -302,7 +456,7 @@ class IdolGameGUI:
         '''Update all display labels with current player data.'''
         self.coins_label.config(text=f"💰 Coins: {self.player.coins}")
         self.collection_label.config(
-            text=f"📚 Collection: {len(self.player.collection)}/26 idols"
+            text=f"📚 Collection: {self.player.owned_count}/{TOTAL_IDOLS} idols"
         )
         self.draws_label.config(text=f"🎲 Total Draws: {self.player.total_draws}")
     
@@ -323,14 +477,17 @@ class IdolGameGUI:
             self.show_draw_result(idol, is_duplicate, refund)
             self.update_display()
 
-            # Auto-save after each draw
-            self.player.save_to_file()
+            # Auto-save after each draw (coalesced with other recent draws)
+            self.request_auto_save()
+            
+            # Re-queue any draw-result portraits evicted since the last prefetch
+            self.root.after_idle(self.prefetch_draw_results)
 
             # Check if collection is complete
-            if len(self.player.collection) == 26 and not is_duplicate:
+            if self.player.is_complete and not is_duplicate:
                 messagebox.showinfo(
                     "🎉 CONGRATULATIONS! 🎉",
-                    "✨ You've collected all 26 idols! ✨\n\n"
+                    f"✨ You've collected all {TOTAL_IDOLS} idols! ✨\n\n"
                     "🌟 Amazing work, Producer!\n"
                     "💪 Continue playing to level up your idols!"
                 )
@@ -353,25 +510,51 @@ class IdolGameGUI:
 
             # Check if we just completed the collection
             new_idols = [r for r in results if not r[1]]  # Get non-duplicates
-            collection_completed = len(self.player.collection) == 26 and len(new_idols) > 0
+            collection_completed = self.player.is_complete and len(new_idols) > 0
 
             self.show_ten_draw_results(results)
             self.update_display()
 
-            # Auto-save after each draw
-            self.player.save_to_file()
+            # Auto-save after each draw (coalesced with other recent draws)
+            self.request_auto_save()
+            
+            # Re-queue any draw-result portraits evicted since the last prefetch
+            self.root.after_idle(self.prefetch_draw_results)
 
             # Show completion message after results
             if collection_completed:
                 messagebox.showinfo(
                     "🎉 CONGRATULATIONS! 🎉",
-                    "✨ You've collected all 26 idols! ✨\n\n"
+                    f"✨ You've collected all {TOTAL_IDOLS} idols! ✨\n\n"
                     "🌟 Amazing work, Producer!\n"
                     "💪 Continue playing to level up your idols!"
                 )
         except Exception as e:
             messagebox.showerror("Error", f"Draw failed: {e}")
 
+    def request_auto_save(self) -> None:
+        '''Queue an auto-save and make sure it is written once the coalescing window ends.'''
+        self.save_manager.request_save()
+        if self.save_manager.pending:
+            delay_ms = int(self.save_manager.delay * 1000)
+            self.root.after(delay_ms, self.flush_auto_save)
+        else:
+            self.poll_save_results()
+
+    def flush_auto_save(self) -> None:
+        '''Hand a due auto-save to the save worker and watch for its result.'''
+        self.save_manager.flush_if_due()
+        self.poll_save_results()
+
+    def poll_save_results(self) -> None:
+        '''Report finished background saves; keeps polling while the worker is busy.'''
+        for filename, error in self.save_worker.poll_results():
+            if error is not None:
+                messagebox.showerror("Auto-save Failed", f"Could not save {filename}:\n{error}")
+
+        if self.save_worker.busy():
+            self.root.after(100, self.poll_save_results)
+
     def show_draw_result(self, idol: 'IdolCard', is_duplicate: bool, refund: int) -> None:
         '''
         Display single draw result in a popup window.
@@ -647,38 +830,19 @@ class IdolGameGUI:
         content_frame = tk.Frame(self.collection_window, bg=self.colors['frame_bg'])
         content_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
 
-        # Left side - scrollable list
-        list_frame = tk.Frame(content_frame, bg=self.colors['frame_bg'])
-        list_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-
-        canvas = tk.Canvas(list_frame, bg=self.colors['frame_bg'])
-        scrollbar = tk.Scrollbar(list_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas, bg=self.colors['frame_bg'])
-
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-
-        # Display idols
-        idols = self.player.get_collection_list("rarity")
-        for i, idol in enumerate(idols, 1):
+        # Left side - scrollable list (only the visible rows exist as widgets)
+        def idol_row_text(index: int, idol: 'IdolCard') -> str:
             symbol = RARITY_SYMBOLS.get(idol.rarity, "⭐")
-            idol_text = f"{i:2d}. {symbol} {idol.name} | Lv.{idol.level} | {idol.fans:,} fans"
+            return f"{index + 1:2d}. {symbol} {idol.name} | Lv.{idol.level} | {idol.fans:,} fans"
 
-            tk.Label(
-                scrollable_frame,
-                text=idol_text,
-                font=("Arial", 11),
-                bg=self.colors['frame_bg'],
-                anchor="w"
-            ).pack(fill=tk.X, padx=10, pady=3)
-
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        idols = self.player.get_collection_list("rarity")
+        VirtualList(
+            content_frame,
+            idols,
+            idol_row_text,
+            bg=self.colors['frame_bg'],
+            font=("Arial", 11)
+        ).pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
         # Right side - statistics (vertically centered)
         stats_frame = tk.Frame(content_frame, bg=self.colors['frame_bg'])
@@ -689,9 +853,9 @@ class IdolGameGUI:
 
         total_fans = self.player.get_total_fans()
         stats_text = (
-            f"📊 Total: {len(self.player.collection)}/26 idols\n"
+            f"📊 Total: {self.player.owned_count}/{TOTAL_IDOLS} idols\n"
             f"👥 Total Fans: {total_fans:,}\n"
-            f"⭐ Collection Rate: {len(self.player.collection)/26*100:.1f}%"
+            f"⭐ Collection Rate: {self.player.completion_rate:.1f}%"
         )
 
         tk.Label(
@@ -728,6 +892,9 @@ class IdolGameGUI:
             )
             return
 
+        # Start decoding the portraits this window is about to show
+        self.prefetch_collection()
+
         # Create profiles window
         self.profiles_window = tk.Toplevel(self.root)
         self.profiles_window.title("Idol Profiles")
@@ -1036,9 +1203,21 @@ class IdolGameGUI:
 
         if response:
             try:
-                # Delete save file
-                if os.path.exists("player_data.txt"):
-                    os.remove("player_data.txt")
+                # Drop queued auto-saves and let any in-flight write finish
+                # so nothing can recreate the file after it is deleted
+                self.save_manager.discard()
+                self.save_worker.wait_idle()
+                if self.player.journal is not None:
+                    self.player.journal.close()
+
+                # Delete save file and any draw journal
+                for path in ("player_data.txt", journal_path("player_data.txt")):
+                    if os.path.exists(path):
+                        os.remove(path)
+
+                # Only stop background work once the reset can no longer fail
+                self.save_worker.close()
+                self.decode_pool.shutdown(wait=False, cancel_futures=True)
 
                 # Show success message and exit
                 messagebox.showinfo(
@@ -1059,5 +1238,15 @@ class IdolGameGUI:
 
     def save_and_exit(self) -> None:
         '''Save game and exit.'''
-        self.player.save_to_file(silent=False)
+        self.save_manager.flush(force=True)  # A full snapshot, so no journal is left to replay
+        if self.player.journal is not None:
+            self.player.journal.close()
+        self.save_worker.close()
+        self.decode_pool.shutdown(wait=False, cancel_futures=True)
+
+        errors = [error for _, error in self.save_worker.poll_results() if error is not None]
+        if errors:
+            messagebox.showerror("Save Failed", f"Could not save game data:\n{errors[-1]}")
+        else:
+            print("✅ Game saved successfully!")
         self.root.quit()
\ No newline at end of file
@@ -3,7 +3,7 @@ IdolCard Class - Represents an individual idol card with complete profile
 '''
 
 from config import BASE_FANS, RARITY_SYMBOLS, FAN_INCREASE_PER_LEVEL
-from idol_profiles import get_idol_profile
+from idol_profiles import get_profile_record, ProfileRecord
 
 
 class IdolCard:
@@ -11,9 +11,12 @@ class IdolCard:
     Represents an idol card with gameplay stats and personality traits.
     
     Each idol has level and fans for progression, plus unique personality
-    attributes loaded from the profile database.
+    attributes loaded from the profile database. Cards use __slots__ and
+    share one immutable ProfileRecord per idol, so they stay small.
     '''
     
+    __slots__ = ("name", "rarity", "level", "fans", "profile")
+    
     def __init__(self, name: str, rarity: str, level: int = 1, fans: int | None = None) -> None:
         '''
         Initialises an idol card with both gameplay and profile data.
@@ -33,18 +36,28 @@ class IdolCard:
         else:
             self.fans = fans
         
-        # Load personality profile
-        profile = get_idol_profile(name)
-        if profile:
-            self.mood = profile.get("mood", "Unknown")
-            self.color = profile.get("color", "Unknown")
-            self.hobby = profile.get("hobby", "Unknown")
-            self.description = profile.get("description", "A mysterious idol.")
-        else:
-            self.mood = "Unknown"
-            self.color = "Unknown"
-            self.hobby = "Unknown"
-            self.description = "A mysterious idol with an unknown background."
+        # Shared personality profile (one record per idol, never copied)
+        self.profile: ProfileRecord = get_profile_record(name)
+    
+    @property
+    def mood(self) -> str:
+        '''The idol's mood from the shared profile.'''
+        return self.profile.mood
+    
+    @property
+    def color(self) -> str:
+        '''The idol's signature color from the shared profile.'''
+        return self.profile.color
+    
+    @property
+    def hobby(self) -> str:
+        '''The idol's hobby from the shared profile.'''
+        return self.profile.hobby
+    
+    @property
+    def description(self) -> str:
+        '''The idol's description from the shared profile.'''
+        return self.profile.description
     
     def level_up(self) -> None:
         '''
@@ -2,6 +2,8 @@
 Complete database of all 26 idols with detailed personality profiles
 '''
 
+from typing import NamedTuple
+
 IDOL_PROFILES = {
     # Common Tier
     "Amy": {
@@ -236,4 +238,35 @@ def get_all_profiles_by_rarity(rarity: str) -> dict:
         name: profile
         for name, profile in IDOL_PROFILES.items()
         if profile["rarity"] == rarity
-    }
\ No newline at end of file
+    }
+
+
+class ProfileRecord(NamedTuple):
+    '''Immutable personality data shared by every card of the same idol.'''
+    mood: str
+    color: str
+    hobby: str
+    description: str
+
+
+# Fallback record for idols missing from the profile database
+UNKNOWN_PROFILE = ProfileRecord(
+    "Unknown", "Unknown", "Unknown",
+    "A mysterious idol with an unknown background."
+)
+
+# One shared record per idol, built once at import
+PROFILE_RECORDS = {
+    name: ProfileRecord(
+        profile.get("mood", "Unknown"),
+        profile.get("color", "Unknown"),
+        profile.get("hobby", "Unknown"),
+        profile.get("description", "A mysterious idol.")
+    )
+    for name, profile in IDOL_PROFILES.items()
+}
+
+
+def get_profile_record(name: str) -> ProfileRecord:
+    '''Returns the shared immutable profile record for an idol, or UNKNOWN_PROFILE.'''
+    return PROFILE_RECORDS.get(name, UNKNOWN_PROFILE)
@@ -2,14 +2,35 @@
 Player Class - Manages player data, collection, and game operations
 '''
 
-from gacha_system import GachaSystem
+import os
+import random
+import sqlite3
+from bisect import bisect_left, insort
+from gacha_system import GachaSystem, GUARANTEE_RARITIES
 from idol_card import IdolCard
+from collection_store import CollectionStore
+from draw_journal import DrawJournal, replay_journal, journal_path
+from binary_save import is_binary_save, encode_binary_save, decode_binary_save
+from save_manager import atomic_write
+from save_summary import read_save_summary
 from config import (
     STARTING_COINS, SINGLE_DRAW_COST, TEN_DRAW_COST,
     DUPLICATE_REFUND_RATES, SAVE_FILE_NAME, 
-    BANKRUPTCY_BONUS_SINGLE, BANKRUPTCY_BONUS_TEN
+    BANKRUPTCY_BONUS_SINGLE, BANKRUPTCY_BONUS_TEN,
+    RARITY_TIERS, IDOL_ID_NAMES, TOTAL_IDOLS, RARITY_SORT_ORDER,
+    JOURNAL_SNAPSHOT_EVERY, SAVE_BINARY
 )
 
+# Sort keys for get_collection_list; names break ties so every key is unique
+SORT_KEYS = {
+    "rarity": lambda idol: (RARITY_SORT_ORDER.get(idol.rarity, 4), idol.name),  # Rarity tier, then name
+    "name": lambda idol: idol.name,  # Alphabetically by name
+    "level": lambda idol: (-idol.level, idol.name),  # Highest level first, then name
+}
+
+# Attributes a lazy load leaves unset until the collection is first needed (see Player.__getattr__)
+LAZY_FIELDS = ("collection", "gacha", "rarity_counts", "highest_level", "_sorted_views")
+
 
 class Player:
     '''
@@ -18,16 +39,50 @@ class Player:
     Each player has a coin balance, collection of idols, and draw statistics.
     '''
     
-    def __init__(self) -> None:
+    def __init__(self, rng: random.Random | None = None, compact: bool = False) -> None:
         '''
         Initialises a new player with default starting values.
         
         Sets starting coins, empty collection, zero draws, and gacha system.
+        
+        Parameters:
+            rng (random.Random | None): This player's own draw stream, e.g.
+                rng_streams.spawn_rng(seed, "player", index). Unseeded if None.
+            compact (bool): If True, keep the collection in an array-backed CollectionStore
+                instead of a dict of IdolCard objects. Defaults to False.
         '''
         self.coins = STARTING_COINS
-        self.collection = {}
+        self.collection = CollectionStore() if compact else {}
         self.total_draws = 0
-        self.gacha = GachaSystem()
+        self.gacha = GachaSystem(rng)
+        
+        # Running collection aggregates, updated in O(1) by add_idol and level_up_idol
+        self.total_fans = 0
+        self.rarity_counts = {rarity: 0 for rarity in RARITY_TIERS}
+        self.highest_level = 0
+        
+        # Sorted collection lists by sort order, built on first use and patched in place
+        self._sorted_views = {}
+        
+        # Optional append-only draw journal (see enable_journal)
+        self.journal = None
+        
+        # Optional multi-player backend replacing the save file (see use_storage)
+        self.storage = None
+        self.player_id = None
+        
+        # Save file and summary of a lazy load whose collection is not read yet
+        self._lazy_source = None
+        self._lazy_summary = None
+        self._lazy_parked = {}
+    
+    def __getattr__(self, name: str):
+        '''Reads the collection of a lazy load the first time a collection-dependent attribute is used.'''
+        # Only called when normal lookup fails, i.e. for fields a lazy load has parked
+        if name in LAZY_FIELDS and self.__dict__.get("_lazy_source") is not None:
+            self._materialize()
+            return getattr(self, name)
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
     
     def has_idol(self, name: str) -> IdolCard | None:
         '''
@@ -48,7 +103,97 @@ class Player:
         Parameters:
             idol (IdolCard): The idol card to add to the player's collection.
         '''
+        replaced = self.collection.get(idol.name)
+        replaced_level = 0
+        if replaced:
+            replaced_level = replaced.level  # Read now: a compact store's view follows the new card
+            self.total_fans -= replaced.fans
+            self.rarity_counts[replaced.rarity] -= 1
+            for sort_by in list(self._sorted_views):
+                self._remove_sorted(sort_by, replaced)
+        
         self.collection[idol.name] = idol
+        
+        self.total_fans += idol.fans
+        self.rarity_counts[idol.rarity] = self.rarity_counts.get(idol.rarity, 0) + 1
+        if replaced_level == self.highest_level and idol.level < replaced_level:
+            # The replaced card held the maximum; rare enough that a rescan is fine
+            self.highest_level = max(owned.level for owned in self.collection.values())
+        else:
+            self.highest_level = max(self.highest_level, idol.level)
+        for sort_by, view in self._sorted_views.items():
+            insort(view, self.collection[idol.name], key=SORT_KEYS[sort_by])
+        
+        if self.journal is not None:
+            self.journal.mark_changed(idol.name)
+    
+    def level_up_idol(self, idol: IdolCard) -> None:
+        '''
+        Levels up an owned idol and updates the collection aggregates.
+        
+        Parameters:
+            idol (IdolCard): The owned idol to level up.
+        '''
+        # Only the level ordering changes: move this one entry instead of re-sorting
+        level_view = self._sorted_views.get("level")
+        if level_view is not None:
+            self._remove_sorted("level", idol)
+        
+        fans_before = idol.fans
+        idol.level_up()
+        self.total_fans += idol.fans - fans_before
+        self.highest_level = max(self.highest_level, idol.level)
+        
+        if level_view is not None:
+            insort(level_view, idol, key=SORT_KEYS["level"])
+        
+        if self.journal is not None:
+            self.journal.mark_changed(idol.name)
+    
+    def _remove_sorted(self, sort_by: str, idol: IdolCard) -> None:
+        '''Removes an idol from one cached sorted view using a binary search on its current key.'''
+        view = self._sorted_views[sort_by]
+        key = SORT_KEYS[sort_by]
+        index = bisect_left(view, key(idol), key=key)
+        if index < len(view) and view[index].name == idol.name:
+            del view[index]
+        else:
+            # Key changed outside level_up_idol; drop the view so it is rebuilt
+            del self._sorted_views[sort_by]
+    
+    def rebuild_stats(self) -> None:
+        '''Recomputes the collection aggregates from scratch and drops cached sorted views (e.g. after loading).'''
+        self._sorted_views = {}
+        self.total_fans = 0
+        self.rarity_counts = {rarity: 0 for rarity in RARITY_TIERS}
+        self.highest_level = 0
+        
+        for idol in self.collection.values():
+            self.total_fans += idol.fans
+            self.rarity_counts[idol.rarity] = self.rarity_counts.get(idol.rarity, 0) + 1
+            self.highest_level = max(self.highest_level, idol.level)
+    
+    @property
+    def is_loaded(self) -> bool:
+        '''Whether the collection has been read (False while a lazy load is pending).'''
+        return self._lazy_source is None
+    
+    @property
+    def owned_count(self) -> int:
+        '''Number of distinct idols in the collection.'''
+        if self._lazy_summary is not None:
+            return self._lazy_summary.owned_count
+        return len(self.collection)
+    
+    @property
+    def completion_rate(self) -> float:
+        '''Percentage of the full idol roster that has been collected.'''
+        return self.owned_count / TOTAL_IDOLS * 100
+    
+    @property
+    def is_complete(self) -> bool:
+        '''Whether every idol in the roster has been collected.'''
+        return self.owned_count >= TOTAL_IDOLS
     
     def calculate_refund(self, idol: IdolCard) -> int:
         '''
@@ -65,6 +210,29 @@ class Player:
         refund_rate = DUPLICATE_REFUND_RATES[idol.rarity]
         return int(SINGLE_DRAW_COST * refund_rate)
     
+    def resolve_draw(self, idol: IdolCard) -> tuple[IdolCard, bool, int]:
+        '''
+        Applies a drawn card to the collection.
+        
+        New idols are added; duplicates level up the owned idol and refund coins.
+        
+        Parameters:
+            idol (IdolCard): The freshly drawn idol card.
+        
+        Returns:
+            tuple[IdolCard, bool, int]: The owned idol, whether it was a duplicate, and the refund.
+        '''
+        existing_idol = self.has_idol(idol.name)
+        
+        if existing_idol:
+            self.level_up_idol(existing_idol)
+            refund = self.calculate_refund(existing_idol)
+            self.coins += refund
+            return (existing_idol, True, refund)
+        
+        self.add_idol(idol)
+        return (self.has_idol(idol.name), False, 0)
+    
     def single_draw(self) -> tuple[IdolCard, bool, int, bool]:
         '''
         Performs a single card draw.
@@ -88,18 +256,8 @@ class Player:
         self.coins -= SINGLE_DRAW_COST
         self.total_draws += 1
         
-        idol = self.gacha.generate_card()
-        
-        existing_idol = self.has_idol(idol.name)
-        
-        if existing_idol:
-            existing_idol.level_up()
-            refund = self.calculate_refund(existing_idol)
-            self.coins += refund
-            return (existing_idol, True, refund, bankruptcy_triggered)
-        else:
-            self.add_idol(idol)
-            return (idol, False, 0, bankruptcy_triggered)
+        idol, is_duplicate, refund = self.resolve_draw(self.gacha.generate_card())
+        return (idol, is_duplicate, refund, bankruptcy_triggered)
     
     def ten_draw(self) -> tuple[list[tuple[IdolCard, bool, int]], bool]:
         '''
@@ -130,19 +288,10 @@ class Player:
             idol = self.gacha.generate_card()
             
             # Check if player got Rare or better (Rare, Epic, or Legendary)
-            if idol.rarity in ["Rare", "Epic", "Legendary"]:
+            if idol.rarity in GUARANTEE_RARITIES:
                 has_rare_or_better = True
             
-            existing_idol = self.has_idol(idol.name)
-            
-            if existing_idol:
-                existing_idol.level_up()
-                refund = self.calculate_refund(existing_idol)
-                self.coins += refund
-                results.append((existing_idol, True, refund))
-            else:
-                self.add_idol(idol)
-                results.append((idol, False, 0))
+            results.append(self.resolve_draw(idol))
         
         # 10th card: guarantee Rare+ if first 9 cards were all Common
         if not has_rare_or_better:
@@ -150,83 +299,220 @@ class Player:
         else:
             idol = self.gacha.generate_card()
         
-        existing_idol = self.has_idol(idol.name)
-        
-        if existing_idol:
-            existing_idol.level_up()
-            refund = self.calculate_refund(existing_idol)
-            self.coins += refund
-            results.append((existing_idol, True, refund))
-        else:
-            self.add_idol(idol)
-            results.append((idol, False, 0))
+        results.append(self.resolve_draw(idol))
         
         return (results, bankruptcy_triggered)
     
+    def draw_many(self, count: int, ten_draw: bool = False) -> tuple[list[str], dict[str, int], int, int]:
+        '''
+        Performs many single draws or ten-draws in one call and aggregates the results.
+        
+        Cards are generated in one batch and applied with the same cost, refund,
+        guarantee, and bankruptcy rules as single_draw and ten_draw. No per-card
+        result tuples are built and duplicates never construct an IdolCard.
+        
+        Parameters:
+            count (int): Number of draws to perform.
+            ten_draw (bool): If True, each draw is a ten-draw. Defaults to False.
+        
+        Returns:
+            tuple[list[str], dict[str, int], int, int]: A tuple containing:
+                - Names of newly collected idols, in draw order
+                - Number of level-ups per idol name
+                - Total refund in coins
+                - Number of times bankruptcy protection was triggered
+        '''
+        if ten_draw:
+            cards_per_draw, cost, bonus = 10, TEN_DRAW_COST, BANKRUPTCY_BONUS_TEN
+        else:
+            cards_per_draw, cost, bonus = 1, SINGLE_DRAW_COST, BANKRUPTCY_BONUS_SINGLE
+        
+        rarity_ids, idol_ids = self.gacha.generate_cards(count * cards_per_draw, ten_draw=ten_draw)
+        rarity_ids = rarity_ids.tolist()
+        idol_ids = idol_ids.tolist()
+        
+        new_idols = []
+        level_ups = {}
+        total_refund = 0
+        bankruptcies = 0
+        
+        for start in range(0, count * cards_per_draw, cards_per_draw):
+            # Bankruptcy protection, checked once per draw as in single_draw/ten_draw
+            if self.coins < cost:
+                self.coins += bonus
+                bankruptcies += 1
+            
+            self.coins -= cost
+            self.total_draws += cards_per_draw
+            
+            for i in range(start, start + cards_per_draw):
+                name = IDOL_ID_NAMES[idol_ids[i]]
+                existing_idol = self.collection.get(name)
+                
+                if existing_idol:
+                    self.level_up_idol(existing_idol)
+                    refund = self.calculate_refund(existing_idol)
+                    self.coins += refund
+                    total_refund += refund
+                    level_ups[name] = level_ups.get(name, 0) + 1
+                else:
+                    self.add_idol(IdolCard(name, RARITY_TIERS[rarity_ids[i]]))
+                    new_idols.append(name)
+        
+        return (new_idols, level_ups, total_refund, bankruptcies)
+    
     def get_collection_list(self, sort_by: str = "rarity") -> list[IdolCard]:
         '''
         Returns a sorted list of idols in the collection.
         
+        Each order is sorted once and then kept up to date by add_idol and
+        level_up_idol, so repeated calls only copy the cached list.
+        
         Parameters:
             sort_by (str): Sort method - "rarity", "name", or "level". Defaults to "rarity".
         
         Returns:
             list[IdolCard]: Sorted list of IdolCard objects.
         '''
-        idols = list(self.collection.values())
+        if sort_by not in SORT_KEYS:
+            return list(self.collection.values())
         
-        if sort_by == "rarity":
-            rarity_order = {"Legendary": 0, "Epic": 1, "Rare": 2, "Common": 3}
-            idols.sort(key=lambda x: (rarity_order.get(x.rarity, 4), x.name))  # Sort by rarity tier, then name
-        elif sort_by == "name":
-            idols.sort(key=lambda x: x.name)  # Sort alphabetically by name
-        elif sort_by == "level":
-            idols.sort(key=lambda x: (-x.level, x.name))  # Sort by level (highest first), then name
+        view = self._sorted_views.get(sort_by)
+        if view is None:
+            view = sorted(self.collection.values(), key=SORT_KEYS[sort_by])
+            self._sorted_views[sort_by] = view
         
-        return idols
+        return list(view)
     
     def get_total_fans(self) -> int:
         '''Returns the total fan count across all idols in the collection.'''
-        return sum(idol.fans for idol in self.collection.values())
+        return self.total_fans
     
-    def save_to_file(self, filename: str | None = None, silent: bool = True) -> None:
+    def enable_journal(self, filename: str | None = None, snapshot_every: int = JOURNAL_SNAPSHOT_EVERY) -> None:
+        '''
+        Switches saving to journal mode for one save file.
+        
+        Each save_to_file call then appends the changes since the previous save
+        as one small journal record, and only writes a full snapshot every
+        snapshot_every records or when asked to with snapshot=True.
+        
+        Parameters:
+            filename (str | None): Name of the save file. Uses default from config if None.
+            snapshot_every (int): Journal records between full snapshots. Defaults to config value.
+        '''
+        if filename is None:
+            filename = SAVE_FILE_NAME
+        
+        if self.journal is not None:
+            self.journal.close()
+        self.journal = DrawJournal(filename, snapshot_every)
+    
+    def use_storage(self, storage, player_id: str) -> None:
+        '''
+        Routes save_to_file and load_from_file to a multi-player backend instead of a save file.
+        
+        Parameters:
+            storage (SQLiteStorage): The shared backend.
+            player_id (str): This player's id in the backend.
+        '''
+        self.storage = storage
+        self.player_id = player_id
+    
+    def save_to_file(self, filename: str | None = None, silent: bool = True, snapshot: bool = False,
+                     binary: bool | None = None) -> None:
         '''
         Saves player data to a text file.
         
         Writes coin balance, total draws, and all idol data to persistent storage.
+        Snapshots are written atomically, so a crash never leaves a half-written file.
+        In journal mode, only appends a journal record unless a snapshot is due.
+        With a storage backend (see use_storage), saves there and ignores filename.
         
         Parameters:
             filename (str | None): Name of the save file. Uses default from config if None.
             silent (bool): If True, suppress success message. Defaults to True.
+            snapshot (bool): If True, always write a full snapshot (e.g. on exit). Defaults to False.
+            binary (bool | None): If True, write the compact binary format instead of text.
+                Uses SAVE_BINARY from config if None.
         '''
         if filename is None:
             filename = SAVE_FILE_NAME
+        if binary is None:
+            binary = SAVE_BINARY
+        
+        journal = self.journal if self.journal is not None and self.journal.save_file == filename else None
         
         try:
-            with open(filename, 'w') as f:
-                # Write player information
-                f.write(f"COINS:{self.coins}\n")
-                f.write(f"DRAWS:{self.total_draws}\n")
-                
-                # Write idol data (one idol per line: name,rarity,level,fans)
-                for idol in self.collection.values():
-                    f.write(f"{idol.name},{idol.rarity},{idol.level},{idol.fans}\n")
+            if self.storage is not None:
+                self.storage.save_player(self.player_id, self.coins, self.total_draws, self.collection.values())
+                if not silent:
+                    print(f"✅ Game saved successfully!")
+                return
+            
+            if journal is not None and not snapshot and not journal.snapshot_due():
+                journal.append(self)
+                if not silent:
+                    print(f"✅ Game saved successfully!")
+                return
+            
+            atomic_write(filename, self.encode_save(binary))
+            
+            # The snapshot now contains everything the journal recorded
+            if journal is not None:
+                journal.reset()
             
             if not silent:
                 print(f"✅ Game saved successfully!")
             
-        except IOError as e:
+        except (IOError, ValueError, sqlite3.Error) as e:
             print(f"❌ Error saving game: {e}")
     
-    def load_from_file(self, filename: str | None = None) -> bool:
+    def encode_save(self, binary: bool | None = None) -> bytes:
+        '''
+        Returns an immutable snapshot of the player as complete save file contents.
+        
+        Parameters:
+            binary (bool | None): If True, use the binary format. Uses SAVE_BINARY from config if None.
+        
+        Returns:
+            bytes: Save file contents, safe to hand to another thread.
+        '''
+        if binary is None:
+            binary = SAVE_BINARY
+        if binary:
+            return encode_binary_save(self.coins, self.total_draws, self.collection.values())
+        return self._encode_text_save()
+    
+    def _encode_text_save(self) -> bytes:
+        '''Returns the full text save format (summary header, then one CSV line per idol).'''
+        # Player information and collection summary (read alone by lazy loads)
+        lines = [
+            f"COINS:{self.coins}\n",
+            f"DRAWS:{self.total_draws}\n",
+            f"OWNED:{self.owned_count}\n",
+            f"FANS:{self.total_fans}\n",
+        ]
+        
+        # Idol data (one idol per line: name,rarity,level,fans)
+        for idol in self.collection.values():
+            lines.append(f"{idol.name},{idol.rarity},{idol.level},{idol.fans}\n")
+        
+        return "".join(lines).encode("utf-8")
+    
+    def load_from_file(self, filename: str | None = None, lazy: bool = False) -> bool:
         '''
-        Loads player data from a text file.
+        Loads player data from a text or binary save file.
         
-        Reads saved coin balance, total draws, and idol collection from file.
+        Reads saved coin balance, total draws, and idol collection from file
+        (the format is detected from the binary magic bytes), then replays any draw journal written since that snapshot.
         Handles missing or corrupted save files gracefully.
+        With a storage backend (see use_storage), loads from there and ignores filename.
         
         Parameters:
             filename (str | None): Name of the save file. Uses default from config if None.
+            lazy (bool): If True, read only the summary header (coins, draws, owned count, total fans)
+                and read the collection when it is first used. Falls back to a full load for saves
+                without a summary header or with a pending journal. Defaults to False.
         
         Returns:
             bool: True if load successful, False otherwise.
@@ -234,37 +520,27 @@ class Player:
         if filename is None:
             filename = SAVE_FILE_NAME
         
+        # Loading again replaces a pending lazy load; its collection is never read
+        self._unpark()
+        
         try:
-            with open(filename, 'r') as f:
-                lines = f.readlines()
-            
-            if len(lines) < 2:
-                raise ValueError("Save file corrupted: insufficient data")
-            
-            coins_line = lines[0].strip()
-            if not coins_line.startswith("COINS:"):
-                raise ValueError("Save file corrupted: invalid format")
-            self.coins = int(coins_line.split(':')[1])
-            
-            draws_line = lines[1].strip()
-            if not draws_line.startswith("DRAWS:"):
-                raise ValueError("Save file corrupted: invalid format")
-            self.total_draws = int(draws_line.split(':')[1])
+            if self.storage is not None:
+                stored = self.storage.load_player(self.player_id)
+                if stored is None:
+                    raise FileNotFoundError(self.player_id)
+                self.coins, self.total_draws, idols = stored
+                self.collection.clear()
+                for idol in idols:
+                    self.collection[idol.name] = idol
+            elif lazy and self._load_summary(filename):
+                print(f"✅ Welcome back, Producer! Game loaded successfully!")
+                return True
+            else:
+                self._load_snapshot(filename)
             
-            self.collection = {}  # Clear existing collection before loading
-            for line in lines[2:]:
-                line = line.strip()
-                if not line:  # Skip empty lines
-                    continue
-                
-                parts = line.split(',')
-                if len(parts) != 4:  # Skip lines with invalid format
-                    continue
-                
-                name, rarity, level, fans = parts
-                idol = IdolCard(name, rarity, int(level), int(fans))
-                self.collection[name] = idol
-                self.gacha.used_names.add(name)
+            # Rebuild the gacha's remaining-name pools and aggregates from the loaded collection
+            self.gacha.set_used_names(self.collection.keys())
+            self.rebuild_stats()
             
             print(f"✅ Welcome back, Producer! Game loaded successfully!")
             return True
@@ -272,7 +548,104 @@ class Player:
         except FileNotFoundError:
             print("No save file found. Starting a new game!")
             return False
-        except (ValueError, IndexError) as e:
+        except (ValueError, IndexError, sqlite3.Error) as e:
             print(f"❌ Save file corrupted: {e}")
             print("Starting a new game with default values.")
             return False
+    
+    def _load_snapshot(self, filename: str) -> None:
+        '''Reads a whole text or binary save file into this player and replays its journal.'''
+        with open(filename, 'rb') as f:
+            data = f.read()
+        
+        if is_binary_save(data):
+            self.coins, self.total_draws, idols = decode_binary_save(data)
+            self.collection.clear()
+            for idol in idols:
+                self.collection[idol.name] = idol
+        else:
+            self._read_text_save(data.decode("utf-8").splitlines())
+        
+        replay_journal(self, filename)
+    
+    def _load_summary(self, filename: str) -> bool:
+        '''
+        Loads only a save file's summary header and parks the collection fields until first use.
+        
+        Returns:
+            bool: False if the save has no summary header or a journal newer than the header.
+        '''
+        journal_file = journal_path(filename)
+        if os.path.exists(journal_file) and os.path.getsize(journal_file) > 0:
+            return False
+        
+        summary = read_save_summary(filename)
+        if summary is None:
+            return False
+        
+        self.coins = summary.coins
+        self.total_draws = summary.total_draws
+        self.total_fans = summary.total_fans
+        self._lazy_parked = {name: self.__dict__.pop(name) for name in LAZY_FIELDS}
+        self._lazy_summary = summary
+        self._lazy_source = filename
+        return True
+    
+    def _unpark(self) -> None:
+        '''Restores the fields parked by a lazy load and forgets its pending source.'''
+        if self._lazy_source is None:
+            return
+        self.__dict__.update(self._lazy_parked)
+        self._lazy_parked = {}
+        self._lazy_source = None
+        self._lazy_summary = None
+    
+    def _materialize(self) -> None:
+        '''Reads the collection of a lazy load, keeping coins and draws changed since the header was read.'''
+        filename = self._lazy_source
+        self._unpark()
+        
+        coins, total_draws = self.coins, self.total_draws
+        try:
+            self._load_snapshot(filename)
+        except (OSError, ValueError, IndexError) as e:
+            print(f"❌ Save file corrupted: {e}")
+            self.collection.clear()
+        self.coins, self.total_draws = coins, total_draws
+        
+        self.gacha.set_used_names(self.collection.keys())
+        self.rebuild_stats()
+    
+    def _read_text_save(self, lines: list[str]) -> None:
+        '''
+        Parses the text save format into this player (kept for older saves and migration).
+        
+        Parameters:
+            lines (list[str]): Lines of the save file.
+        '''
+        if len(lines) < 2:
+            raise ValueError("Save file corrupted: insufficient data")
+        
+        coins_line = lines[0].strip()
+        if not coins_line.startswith("COINS:"):
+            raise ValueError("Save file corrupted: invalid format")
+        self.coins = int(coins_line.split(':')[1])
+        
+        draws_line = lines[1].strip()
+        if not draws_line.startswith("DRAWS:"):
+            raise ValueError("Save file corrupted: invalid format")
+        self.total_draws = int(draws_line.split(':')[1])
+        
+        self.collection.clear()  # Clear existing collection before loading
+        for line in lines[2:]:
+            line = line.strip()
+            if not line:  # Skip empty lines
+                continue
+            
+            parts = line.split(',')
+            if len(parts) != 4:  # Skip lines with invalid format (and the OWNED/FANS summary lines)
+                continue
+            
+            name, rarity, level, fans = parts
+            idol = IdolCard(name, rarity, int(level), int(fans))
+            self.collection[name] = idol
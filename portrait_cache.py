@@ -0,0 +1,99 @@
+'''
+PortraitCache Class - Bounded LRU cache of decoded, resized idol portraits
+'''
+
+import threading
+from collections import OrderedDict
+
+from config import PORTRAIT_CACHE_BYTES
+
+
+class PortraitCache:
+    '''
+    Keeps recently shown portraits keyed by (idol name, size) within a memory budget.
+
+    Each entry is charged the bytes its pixels occupy. When the total goes
+    over max_bytes, the least recently used entries are evicted. Hit, miss
+    and eviction counters show how well the budget fits the workload.
+    '''
+
+    def __init__(self, max_bytes: int = PORTRAIT_CACHE_BYTES) -> None:
+        '''
+        Initialises an empty cache.
+
+        Parameters:
+            max_bytes (int): Memory budget for cached pixels. Defaults to config value.
+        '''
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: tuple) -> bool:
+        return key in self._entries
+
+    def get(self, key: tuple):
+        '''
+        Returns a cached portrait and marks it most recently used.
+
+        Parameters:
+            key (tuple): (idol name, (width, height)).
+
+        Returns:
+            The cached image, or None on a miss.
+        '''
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: tuple, image, nbytes: int) -> None:
+        '''
+        Stores a portrait, evicting least recently used ones to stay within budget.
+
+        Parameters:
+            key (tuple): (idol name, (width, height)).
+            image: The decoded, resized image.
+            nbytes (int): Memory the image's pixels occupy.
+        '''
+        if nbytes > self.max_bytes:
+            return  # Would evict everything and still not fit
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.current_bytes -= old[1]
+
+            self._entries[key] = (image, nbytes)
+            self.current_bytes += nbytes
+
+            while self.current_bytes > self.max_bytes:
+                _, (_, evicted_bytes) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_bytes
+                self.evictions += 1
+
+    def clear(self) -> None:
+        '''Drops every cached portrait (counters are kept).'''
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def stats(self) -> dict[str, int]:
+        '''Returns the hit, miss and eviction counters plus current usage.'''
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+        }
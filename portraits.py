@@ -0,0 +1,69 @@
+'''
+Portrait Decoding - Loads idol portraits at display size with reduced-scale JPEG decoding
+'''
+
+import math
+
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+
+    # Resize filters from cheapest to best looking
+    RESAMPLE_TIERS = {
+        "fast": Image.Resampling.NEAREST,
+        "balanced": Image.Resampling.BILINEAR,
+        "high": Image.Resampling.LANCZOS,
+    }
+except ImportError:
+    PIL_AVAILABLE = False
+    RESAMPLE_TIERS = {}
+
+from config import PORTRAIT_RESAMPLE
+
+
+def fit_size(source: tuple[int, int], box: tuple[int, int]) -> tuple[int, int]:
+    '''
+    Returns the size an image of the source size shrinks to when fitted into a box, keeping its aspect ratio.
+
+    Parameters:
+        source (tuple[int, int]): Original (width, height).
+        box (tuple[int, int]): Maximum (width, height).
+
+    Returns:
+        tuple[int, int]: Fitted (width, height), never larger than the source.
+    '''
+    scale = min(box[0] / source[0], box[1] / source[1], 1.0)
+    return (max(1, math.ceil(source[0] * scale)), max(1, math.ceil(source[1] * scale)))
+
+
+def decode_portrait(path: str, size: tuple[int, int], quality: str = PORTRAIT_RESAMPLE) -> "Image.Image":
+    '''
+    Decodes a portrait and shrinks it to fit within size.
+
+    JPEGs are decoded by the JPEG decoder at the smallest 1/2, 1/4 or 1/8
+    scale that is still at least as large as the final size, so a
+    1024x1536 portrait shown at 150x150 is decoded at 128x192 instead of
+    full size. Only that small image is then resampled.
+
+    Parameters:
+        path (str): Image file path.
+        size (tuple[int, int]): Maximum (width, height) to display.
+        quality (str): Resample tier - "fast", "balanced" or "high". Defaults to config value.
+
+    Returns:
+        Image.Image: The decoded portrait, at most size.
+    '''
+    if quality not in RESAMPLE_TIERS:
+        raise ValueError(f"Unknown portrait quality: {quality}")
+
+    img = Image.open(path)
+    target = fit_size(img.size, size)
+
+    # Reduced-scale decode; a no-op for formats without draft support (e.g. PNG)
+    img.draft("RGB", target)
+
+    if img.size != target:
+        img = img.resize(target, RESAMPLE_TIERS[quality])
+    else:
+        img.load()
+    return img
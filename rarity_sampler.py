@@ -0,0 +1,74 @@
+'''
+RaritySampler Class - Precompiled alias table for constant-time weighted draws
+'''
+
+import random
+
+
+class RaritySampler:
+    '''
+    Samples rarities from a fixed weight table in O(1) per draw.
+
+    The weights are compiled once into a Walker/Vose alias table, so each
+    draw costs one random number and one table lookup regardless of how
+    many rarities there are. Weights do not need to sum to 1.0.
+    '''
+
+    def __init__(self, rates: dict[str, float]) -> None:
+        '''
+        Compiles the alias table from a rarity-to-weight mapping.
+
+        Parameters:
+            rates (dict[str, float]): Rarity names mapped to non-negative weights.
+        '''
+        total = sum(rates.values())
+        if not rates or total <= 0:
+            raise ValueError("Rarity rates must contain a positive weight")
+
+        self.outcomes = list(rates.keys())
+        size = len(self.outcomes)
+
+        # Scale weights so the average column holds exactly 1.0
+        scaled = [weight * size / total for weight in rates.values()]
+        self.probabilities = [1.0] * size
+        self.aliases = list(range(size))
+
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+        # Fill each under-full column with the remainder of an over-full one
+        while small and large:
+            low = small.pop()
+            high = large.pop()
+            self.probabilities[low] = scaled[low]
+            self.aliases[low] = high
+            scaled[high] -= 1.0 - scaled[low]
+            if scaled[high] < 1.0:
+                small.append(high)
+            else:
+                large.append(high)
+
+        # Leftover columns are full up to floating point error
+        for i in small + large:
+            self.probabilities[i] = 1.0
+
+        # Flattened lookup rows: (keep probability, own outcome, alias outcome)
+        self._table = [
+            (self.probabilities[i], self.outcomes[i], self.outcomes[self.aliases[i]])
+            for i in range(size)
+        ]
+
+    def sample(self, rng: random.Random | None = None) -> str:
+        '''
+        Draws one rarity using a single random number.
+
+        Parameters:
+            rng (random.Random | None): Generator to draw from. Uses the global random module if None.
+
+        Returns:
+            str: The sampled rarity name.
+        '''
+        u = (rng or random).random() * len(self._table)
+        column = int(u)
+        keep, outcome, alias = self._table[column]
+        return outcome if u - column < keep else alias
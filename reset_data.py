@@ -3,6 +3,7 @@ Reset User Data Script - Clear save file and start fresh
 '''
 
 import os
+from draw_journal import journal_path
 
 
 def reset_player_data() -> None:
@@ -32,8 +33,10 @@ def reset_player_data() -> None:
     
     if response.strip().upper() == "YES":
         try:
-            # Delete save file
+            # Delete save file and any draw journal
             os.remove(save_file)
+            if os.path.exists(journal_path(save_file)):
+                os.remove(journal_path(save_file))
             print("\n✓ User data has been reset!")
             print("✓ Next launch will start fresh.\n")
             
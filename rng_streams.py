@@ -0,0 +1,48 @@
+'''
+RNG Streams - Deterministic, independent random streams derived from one root seed
+'''
+
+import hashlib
+import random
+
+
+def derive_seed(root_seed: int, *path: str | int) -> int:
+    '''
+    Derives a 128-bit seed for a named stream from a root seed.
+
+    The same root seed and path always give the same seed, and different paths
+    give statistically independent seeds, so no stream depends on how work was
+    split or in which order streams were created.
+
+    Parameters:
+        root_seed (int): The root seed shared by a whole run.
+        *path (str | int): Stream name, e.g. ("player", 42) or ("worker", 3).
+
+    Returns:
+        int: Seed for the derived stream.
+    '''
+    key = "/".join(str(part) for part in (root_seed, *path))
+    digest = hashlib.sha256(key.encode("utf-8")).digest()
+    return int.from_bytes(digest[:16], "big")
+
+
+def spawn_rng(root_seed: int, *path: str | int) -> random.Random:
+    '''
+    Creates an independent random generator for a named stream.
+
+    Use ("player", index) for a player's draws and ("worker", index) for
+    per-process work that is not tied to a single player.
+
+    Parameters:
+        root_seed (int): The root seed shared by a whole run.
+        *path (str | int): Stream name, e.g. ("player", 42) or ("worker", 3).
+
+    Returns:
+        random.Random: A generator seeded for that stream only.
+    '''
+    return random.Random(derive_seed(root_seed, *path))
+
+
+def new_root_seed() -> int:
+    '''Returns a fresh 64-bit root seed from the operating system's entropy source.'''
+    return random.SystemRandom().getrandbits(64)
@@ -0,0 +1,228 @@
+'''
+SaveManager Class - Crash-safe atomic saves with coalescing of rapid save requests
+'''
+
+import os
+import queue
+import tempfile
+import threading
+import time
+
+from config import SAVE_FILE_NAME, SAVE_COALESCE_SECONDS, SAVE_COALESCE_MAX
+
+# Process umask, read once: os.umask can only be queried by setting it
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def atomic_write(filename: str, data: bytes) -> None:
+    '''
+    Replaces a file's contents so readers only ever see the old or the new version.
+
+    Writes to a temporary file in the same directory, fsyncs it, then renames
+    it over the target. A crash mid-write leaves the previous file untouched.
+    The new file keeps the target's permissions, or gets the umask's default
+    for a new file (mkstemp alone would leave it readable by the owner only).
+
+    Parameters:
+        filename (str): The file to replace.
+        data (bytes): The complete new contents.
+    '''
+    directory = os.path.dirname(os.path.abspath(filename))
+    try:
+        mode = os.stat(filename).st_mode & 0o7777
+    except OSError:
+        mode = 0o666 & ~_UMASK
+
+    fd, temp_path = tempfile.mkstemp(prefix=".tmp-", suffix=".save", dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(temp_path, mode)
+        os.replace(temp_path, filename)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    # Make the rename itself durable where the platform allows syncing a directory
+    try:
+        dir_fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+
+class SaveManager:
+    '''
+    Coalesces back-to-back save requests for one player into fewer durable writes.
+
+    request_save only records that a save is needed. The actual write happens
+    once SAVE_COALESCE_MAX requests have piled up, once the oldest pending
+    request is SAVE_COALESCE_SECONDS old (checked by flush_if_due), or when
+    flush is called, e.g. on exit. With a SaveWorker, flushing only encodes a
+    snapshot and the write itself happens on the worker thread. Players in
+    journal mode or with a storage backend still save through save_to_file,
+    which keeps the journal and backend consistent.
+    '''
+
+    def __init__(self, player, filename: str | None = None,
+                 delay: float = SAVE_COALESCE_SECONDS, max_pending: int = SAVE_COALESCE_MAX,
+                 worker: "SaveWorker | None" = None) -> None:
+        '''
+        Initialises the save manager.
+
+        Parameters:
+            player (Player): The player to save.
+            filename (str | None): Name of the save file. Uses default from config if None.
+            delay (float): Seconds a request may wait before it is written. Defaults to config value.
+            max_pending (int): Requests that force an immediate write. Defaults to config value.
+            worker (SaveWorker | None): Background writer. Saves synchronously if None.
+        '''
+        self.player = player
+        self.filename = filename if filename is not None else SAVE_FILE_NAME
+        self.delay = delay
+        self.max_pending = max_pending
+        self.worker = worker
+        self.pending = 0
+        self.first_pending_at = None
+        self.writes = 0
+
+    def request_save(self) -> None:
+        '''Records that the player changed; writes now only if a window has filled up.'''
+        if self.pending == 0:
+            self.first_pending_at = time.monotonic()
+        self.pending += 1
+
+        if self.pending >= self.max_pending:
+            self.flush()
+        else:
+            self.flush_if_due()
+
+    def flush_if_due(self) -> None:
+        '''Writes pending changes if the oldest request has waited at least delay seconds.'''
+        if self.pending and time.monotonic() - self.first_pending_at >= self.delay:
+            self.flush()
+
+    def flush(self, force: bool = False, silent: bool = True) -> None:
+        '''
+        Writes pending changes immediately.
+
+        Parameters:
+            force (bool): If True, write even when nothing is pending (e.g. Save & Exit), and
+                write a full snapshot rather than a journal record. Defaults to False.
+            silent (bool): If True, suppress success message. Defaults to True.
+        '''
+        if not self.pending and not force:
+            return
+
+        self.pending = 0
+        self.first_pending_at = None
+        if self.worker is not None and self.player.journal is None and self.player.storage is None:
+            self.worker.submit(self.filename, self.player.encode_save())
+        else:
+            self.player.save_to_file(self.filename, silent=silent, snapshot=force)
+        self.writes += 1
+
+    def discard(self) -> None:
+        '''Drops pending requests without writing (e.g. after the save file was reset).'''
+        self.pending = 0
+        self.first_pending_at = None
+
+
+class SaveWorker:
+    '''
+    Background thread that writes save snapshots so the caller never waits on disk.
+
+    Callers hand over an immutable snapshot (the encoded save bytes) with submit.
+    If a newer snapshot for the same file arrives before the older one was
+    written, only the newer one is written. Outcomes are queued as
+    (filename, error or None) for the owning thread to collect with poll_results.
+    '''
+
+    def __init__(self) -> None:
+        '''Starts the worker thread.'''
+        self._condition = threading.Condition()
+        self._pending = {}
+        self._writing = False
+        self._closed = False
+        self.results = queue.Queue()
+
+        self._thread = threading.Thread(target=self._run, name="save-worker", daemon=True)
+        self._thread.start()
+
+    def submit(self, filename: str, data: bytes) -> None:
+        '''
+        Queues a snapshot to be written atomically, replacing any unwritten one for the same file.
+
+        Parameters:
+            filename (str): The save file to replace.
+            data (bytes): The complete encoded save contents.
+        '''
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Save worker is closed")
+            self._pending[filename] = data
+            self._condition.notify_all()
+
+    def busy(self) -> bool:
+        '''Returns True while snapshots are queued or being written.'''
+        with self._condition:
+            return bool(self._pending) or self._writing
+
+    def wait_idle(self) -> None:
+        '''Blocks until every queued snapshot has been written.'''
+        with self._condition:
+            while self._pending or self._writing:
+                self._condition.wait()
+
+    def poll_results(self) -> list[tuple[str, Exception | None]]:
+        '''Returns every finished write as (filename, error or None) without blocking.'''
+        finished = []
+        while True:
+            try:
+                finished.append(self.results.get_nowait())
+            except queue.Empty:
+                return finished
+
+    def close(self, wait: bool = True) -> None:
+        '''
+        Stops the worker after it has written every queued snapshot.
+
+        Parameters:
+            wait (bool): If True, block until the last write has finished. Defaults to True.
+        '''
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if wait:
+            self._thread.join()
+
+    def _run(self) -> None:
+        '''Worker loop: take the next snapshot, write it, report the outcome.'''
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if not self._pending:
+                    return
+                filename = next(iter(self._pending))
+                data = self._pending.pop(filename)
+                self._writing = True
+
+            try:
+                atomic_write(filename, data)
+                self.results.put((filename, None))
+            except OSError as e:
+                self.results.put((filename, e))
+            finally:
+                with self._condition:
+                    self._writing = False
+                    self._condition.notify_all()
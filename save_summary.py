@@ -0,0 +1,51 @@
+'''
+Save Summary - Reads the summary header of a save file without parsing its collection
+
+Text saves start with COINS, DRAWS, OWNED and FANS lines; binary saves carry
+the same fields in their fixed-size header (see binary_save). Saves written
+before the summary existed have no OWNED/FANS fields and return None.
+'''
+
+from typing import NamedTuple
+
+from binary_save import MAGIC, HEADER, decode_binary_summary
+
+
+class SaveSummary(NamedTuple):
+    '''Player totals stored at the top of a save file.'''
+    coins: int
+    total_draws: int
+    owned_count: int
+    total_fans: int
+
+
+SUMMARY_FIELDS = ("COINS", "DRAWS", "OWNED", "FANS")
+
+
+def read_save_summary(filename: str) -> SaveSummary | None:
+    '''
+    Reads only the summary header of a text or binary save file.
+
+    Parameters:
+        filename (str): The save file.
+
+    Returns:
+        SaveSummary | None: The stored totals, or None if the save predates the summary header.
+    '''
+    with open(filename, 'rb') as f:
+        if f.read(len(MAGIC)) == MAGIC:
+            f.seek(0)
+            fields = decode_binary_summary(f.read(HEADER.size))
+            return SaveSummary(*fields) if fields is not None else None
+
+        f.seek(0)
+        values = []
+        for field in SUMMARY_FIELDS:
+            key, _, value = f.readline().decode("utf-8").strip().partition(":")
+            if key != field:
+                if field in ("COINS", "DRAWS"):
+                    raise ValueError("Save file corrupted: invalid format")
+                return None
+            values.append(int(value))
+
+    return SaveSummary(*values)
@@ -0,0 +1,232 @@
+'''
+ShardedSaveStore Class - Multi-player save directory sharded by player id hash, with a fixed-width index
+
+Layout under the store's root directory:
+    index.bin                 header, then one fixed-width record per save written
+    g<generation>/xx/yy.pack  append-only pack files holding binary saves (see binary_save)
+
+Each player id hashes to one of shard_count shards, and each shard is one
+pack file inside a two-level hashed subdirectory, so no directory grows
+large. An index record maps a player id to its shard, offset and length plus
+summary fields (coins, draws, owned count, total fans); the newest record for
+an id wins. Locating, summarizing or enumerating players only reads the index.
+'''
+
+import hashlib
+import os
+import shutil
+import struct
+import threading
+from typing import NamedTuple
+
+from binary_save import encode_binary_save, decode_binary_save
+from idol_card import IdolCard
+from save_manager import atomic_write
+from config import SAVE_SHARD_COUNT
+
+INDEX_MAGIC = b"IDIX"
+INDEX_VERSION = 1
+PLAYER_ID_BYTES = 32
+
+INDEX_HEADER = struct.Struct("<4sHIH")  # magic, version, generation, shard count
+INDEX_RECORD = struct.Struct(f"<{PLAYER_ID_BYTES}sHQIqqHQ")  # id, shard, offset, length, coins, draws, owned, fans
+
+
+class IndexEntry(NamedTuple):
+    '''Where one player's newest save lives, and its summary fields.'''
+    shard: int
+    offset: int
+    length: int
+    coins: int
+    total_draws: int
+    owned_count: int
+    total_fans: int
+
+
+class ShardedSaveStore:
+    '''
+    Stores many players' saves in hashed shard files under one directory.
+
+    Implements the same save_player/load_player interface as SQLiteStorage,
+    so a Player can use it through Player.use_storage. Saving appends the
+    binary save to the player's shard and one record to the index; compact
+    rewrites the shards without superseded saves.
+    '''
+
+    def __init__(self, root: str, shard_count: int = SAVE_SHARD_COUNT) -> None:
+        '''
+        Opens the store, creating it if needed, and reads the index.
+
+        Parameters:
+            root (str): Directory holding the index and shard files.
+            shard_count (int): Shards for a new store (1-65536). Existing stores keep their own. Defaults to config value.
+        '''
+        self.root = root
+        self.index_path = os.path.join(root, "index.bin")
+        self.entries = {}
+        self._lock = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+
+        if os.path.exists(self.index_path):
+            self._read_index()
+        else:
+            if not 1 <= shard_count <= 65536:
+                raise ValueError(f"Shard count must be between 1 and 65536: {shard_count}")
+            self.generation = 0
+            self.shard_count = shard_count
+            atomic_write(self.index_path, self._index_header())
+
+    def _index_header(self) -> bytes:
+        '''Returns the packed index header for the current generation.'''
+        return INDEX_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, self.generation, self.shard_count - 1)
+
+    def _read_index(self) -> None:
+        '''Loads every index record into memory; the newest record per player id wins.'''
+        with open(self.index_path, 'rb') as f:
+            data = f.read()
+
+        if len(data) < INDEX_HEADER.size:
+            raise ValueError("Save index corrupted: header too short")
+        magic, version, self.generation, last_shard = INDEX_HEADER.unpack_from(data)
+        if magic != INDEX_MAGIC:
+            raise ValueError("Save index corrupted: invalid format")
+        if version != INDEX_VERSION:
+            raise ValueError(f"Unsupported save index version: {version}")
+        self.shard_count = last_shard + 1
+
+        # Drop a final record cut short by a crash so later appends stay aligned
+        end = len(data) - (len(data) - INDEX_HEADER.size) % INDEX_RECORD.size
+        if end != len(data):
+            os.truncate(self.index_path, end)
+
+        for raw_id, *fields in INDEX_RECORD.iter_unpack(data[INDEX_HEADER.size:end]):
+            try:
+                player_id = raw_id.rstrip(b"\0").decode("utf-8")
+            except UnicodeDecodeError:
+                raise ValueError("Save index corrupted: invalid player id") from None
+            self.entries[player_id] = IndexEntry(*fields)
+
+    def shard_of(self, player_id: str) -> int:
+        '''Returns the shard a player id hashes to.'''
+        digest = hashlib.sha256(player_id.encode("utf-8")).digest()
+        return int.from_bytes(digest[:4], "little") % self.shard_count
+
+    def shard_path(self, shard: int, generation: int | None = None) -> str:
+        '''Returns the pack file path of a shard, e.g. root/g0/00/2a.pack.'''
+        if generation is None:
+            generation = self.generation
+        return os.path.join(self.root, f"g{generation}", f"{shard >> 8:02x}", f"{shard & 0xff:02x}.pack")
+
+    @staticmethod
+    def _encode_id(player_id: str) -> bytes:
+        '''Returns a player id as index bytes, rejecting ids that do not fit.'''
+        raw_id = player_id.encode("utf-8")
+        if not raw_id or len(raw_id) > PLAYER_ID_BYTES or b"\0" in raw_id:
+            raise ValueError(f"Player id must be 1-{PLAYER_ID_BYTES} bytes without NUL: {player_id!r}")
+        return raw_id
+
+    def save_player(self, player_id: str, coins: int, total_draws: int, idols) -> None:
+        '''
+        Appends one player's save to their shard and records it in the index.
+
+        Parameters:
+            player_id (str): The player's id (at most 32 UTF-8 bytes).
+            coins (int): Coin balance.
+            total_draws (int): Total cards drawn.
+            idols (Iterable[IdolCard]): Owned idols.
+        '''
+        raw_id = self._encode_id(player_id)
+        idols = list(idols)
+        data = encode_binary_save(coins, total_draws, idols)
+
+        with self._lock:
+            shard = self.shard_of(player_id)
+            path = self.shard_path(shard)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+            # The save must be durable before the index points at it
+            with open(path, 'ab') as f:
+                offset = f.tell()
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+
+            entry = IndexEntry(shard, offset, len(data), coins, total_draws,
+                               len(idols), sum(idol.fans for idol in idols))
+            with open(self.index_path, 'ab') as f:
+                f.write(INDEX_RECORD.pack(raw_id, *entry))
+                f.flush()
+                os.fsync(f.fileno())
+            self.entries[player_id] = entry
+
+    def load_player(self, player_id: str) -> tuple[int, int, list[IdolCard]] | None:
+        '''
+        Loads one player by reading only their save from their shard.
+
+        Parameters:
+            player_id (str): The player's id.
+
+        Returns:
+            tuple[int, int, list[IdolCard]] | None: Coins, total draws and owned idols, or None if not stored.
+        '''
+        entry = self.entries.get(player_id)
+        if entry is None:
+            return None
+
+        with open(self.shard_path(entry.shard), 'rb') as f:
+            f.seek(entry.offset)
+            data = f.read(entry.length)
+        return decode_binary_save(data)
+
+    def summary(self, player_id: str) -> IndexEntry | None:
+        '''Returns a player's index entry (location and summary fields) without reading their save.'''
+        return self.entries.get(player_id)
+
+    def player_ids(self) -> list[str]:
+        '''Returns the ids of all stored players in sorted order.'''
+        return sorted(self.entries)
+
+    def compact(self) -> None:
+        '''
+        Rewrites every shard with only each player's newest save.
+
+        The compacted shards go into a new generation directory and the index is
+        swapped in atomically, so a crash leaves either the old or the new store.
+        '''
+        with self._lock:
+            generation = self.generation + 1
+            new_dir = os.path.join(self.root, f"g{generation}")
+            if os.path.exists(new_dir):
+                shutil.rmtree(new_dir)  # Left behind by an interrupted compaction
+
+            by_shard = {}
+            for player_id, entry in self.entries.items():
+                by_shard.setdefault(entry.shard, []).append((player_id, entry))
+
+            records = []
+            new_entries = {}
+            for shard, players in by_shard.items():
+                players.sort(key=lambda item: item[1].offset)
+                with open(self.shard_path(shard), 'rb') as f:
+                    saves = []
+                    for _, entry in players:
+                        f.seek(entry.offset)
+                        saves.append(f.read(entry.length))
+
+                offset = 0
+                for (player_id, entry), data in zip(players, saves):
+                    new_entry = entry._replace(offset=offset)
+                    new_entries[player_id] = new_entry
+                    records.append(INDEX_RECORD.pack(self._encode_id(player_id), *new_entry))
+                    offset += len(data)
+
+                path = self.shard_path(shard, generation)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                atomic_write(path, b"".join(saves))
+
+            old_dir = os.path.join(self.root, f"g{self.generation}")
+            self.generation = generation
+            atomic_write(self.index_path, self._index_header() + b"".join(records))
+            self.entries = new_entries
+            if os.path.exists(old_dir):
+                shutil.rmtree(old_dir)
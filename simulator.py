@@ -0,0 +1,185 @@
+'''
+Collection Simulator - Measures the game economy with simulated players
+
+Runs many fresh players from STARTING_COINS until their collection is complete,
+spreading the work across all CPU cores, and reports completion percentiles.
+Each player draws from its own stream derived from one root seed, so a run
+with the same --seed gives identical results for any worker count or chunk size.
+
+HOW TO RUN:
+    python simulator.py --players 100000
+    python simulator.py --players 100000 --ten-draw --workers 8
+    python simulator.py --players 100000 --seed 1234
+'''
+
+import argparse
+import os
+import random
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from player import Player
+from rng_streams import spawn_rng, new_root_seed
+from config import STARTING_COINS, BANKRUPTCY_BONUS_SINGLE, BANKRUPTCY_BONUS_TEN
+
+
+def simulate_player(rng: random.Random | None = None, ten_draw: bool = False) -> tuple[int, int, int]:
+    '''
+    Plays one fresh player until every idol has been collected.
+
+    Parameters:
+        rng (random.Random | None): The player's draw stream. Unseeded if None.
+        ten_draw (bool): If True, the player only uses ten-draws. Defaults to False.
+
+    Returns:
+        tuple[int, int, int]: A tuple containing:
+            - Cards drawn to complete the collection
+            - Net coins spent (draw costs minus duplicate refunds)
+            - Number of bankruptcy bonuses received
+    '''
+    player = Player(rng)
+    bankruptcies = 0
+
+    while not player.is_complete:
+        if ten_draw:
+            _, bankruptcy = player.ten_draw()
+        else:
+            bankruptcy = player.single_draw()[3]
+        bankruptcies += bankruptcy
+
+    bonus = BANKRUPTCY_BONUS_TEN if ten_draw else BANKRUPTCY_BONUS_SINGLE
+    coins_spent = STARTING_COINS + bankruptcies * bonus - player.coins
+    return (player.total_draws, coins_spent, bankruptcies)
+
+
+def simulate_batch(seed: int, start: int, count: int, ten_draw: bool = False) -> dict[str, Counter]:
+    '''
+    Simulates a batch of players and returns their results as histograms.
+
+    Player i always draws from stream ("player", i) of the root seed, whichever
+    batch it lands in.
+
+    Parameters:
+        seed (int): Root seed of the whole run.
+        start (int): Index of the first player in this batch.
+        count (int): Number of players to simulate.
+        ten_draw (bool): If True, players only use ten-draws. Defaults to False.
+
+    Returns:
+        dict[str, Counter]: Histograms keyed by "draws", "coins" and "bankruptcies".
+    '''
+    histograms = {"draws": Counter(), "coins": Counter(), "bankruptcies": Counter()}
+
+    for index in range(start, start + count):
+        draws, coins, bankruptcies = simulate_player(spawn_rng(seed, "player", index), ten_draw)
+        histograms["draws"][draws] += 1
+        histograms["coins"][coins] += 1
+        histograms["bankruptcies"][bankruptcies] += 1
+
+    return histograms
+
+
+def run_simulation(players: int, ten_draw: bool = False, workers: int | None = None,
+                   chunk_size: int = 1000, seed: int | None = None) -> dict[str, Counter]:
+    '''
+    Simulates a population of players across a process pool and merges the histograms.
+
+    Parameters:
+        players (int): Total number of players to simulate.
+        ten_draw (bool): If True, players only use ten-draws. Defaults to False.
+        workers (int | None): Number of worker processes. Uses every CPU core if None.
+        chunk_size (int): Players per submitted task. Defaults to 1000.
+        seed (int | None): Root seed for every player stream. Picks a fresh one if None.
+
+    Returns:
+        dict[str, Counter]: Merged histograms keyed by "draws", "coins" and "bankruptcies".
+    '''
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if seed is None:
+        seed = new_root_seed()
+
+    starts = list(range(0, players, chunk_size))
+    counts = [min(chunk_size, players - start) for start in starts]
+    seeds = [seed] * len(starts)
+    modes = [ten_draw] * len(starts)
+    merged = {"draws": Counter(), "coins": Counter(), "bankruptcies": Counter()}
+
+    # A single worker runs in-process to skip the pool start-up cost
+    if workers == 1:
+        for histograms in map(simulate_batch, seeds, starts, counts, modes):
+            for key, histogram in histograms.items():
+                merged[key].update(histogram)
+        return merged
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for histograms in pool.map(simulate_batch, seeds, starts, counts, modes):
+            for key, histogram in histograms.items():
+                merged[key].update(histogram)
+
+    return merged
+
+
+def percentile(histogram: Counter, q: float) -> int:
+    '''
+    Returns the q-th percentile of a value histogram.
+
+    Parameters:
+        histogram (Counter): Mapping of value to number of occurrences.
+        q (float): Percentile between 0 and 100.
+
+    Returns:
+        int: Smallest value with at least q% of the samples at or below it.
+    '''
+    total = sum(histogram.values())
+    if total == 0:
+        raise ValueError("Cannot take a percentile of an empty histogram")
+
+    threshold = total * q / 100
+    seen = 0
+    for value in sorted(histogram):
+        seen += histogram[value]
+        if seen >= threshold:
+            return value
+    return max(histogram)
+
+
+def print_report(histograms: dict[str, Counter]) -> None:
+    '''Prints mean, p50, p90 and p99 for every merged histogram.'''
+    labels = {
+        "draws": "Cards drawn",
+        "coins": "Coins spent",
+        "bankruptcies": "Bankruptcy bonuses",
+    }
+
+    for key, label in labels.items():
+        histogram = histograms[key]
+        total = sum(histogram.values())
+        mean = sum(value * n for value, n in histogram.items()) / total
+        print(
+            f"{label:<20} mean {mean:10.1f} | p50 {percentile(histogram, 50):7d}"
+            f" | p90 {percentile(histogram, 90):7d} | p99 {percentile(histogram, 99):7d}"
+        )
+
+
+def main() -> None:
+    '''Command-line entry point for the collection simulator.'''
+    parser = argparse.ArgumentParser(description="Simulate players until their collection is complete.")
+    parser.add_argument("--players", type=int, default=10000, help="number of players to simulate")
+    parser.add_argument("--ten-draw", action="store_true", help="use ten-draws instead of single draws")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="players per worker task")
+    parser.add_argument("--seed", type=int, default=None, help="root seed (default: random)")
+    args = parser.parse_args()
+
+    seed = args.seed if args.seed is not None else new_root_seed()
+    mode = "ten-draw" if args.ten_draw else "single draw"
+    print(f"Simulating {args.players:,} players ({mode}, seed {seed})...")
+
+    histograms = run_simulation(args.players, args.ten_draw, args.workers, args.chunk_size, seed)
+    print_report(histograms)
+
+
+if __name__ == "__main__":
+    main()
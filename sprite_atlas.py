@@ -0,0 +1,137 @@
+'''
+SpriteAtlas Class - One memory-mapped file holding every portrait pre-rendered at one display size
+
+Layout (little-endian):
+    header:  magic b"IDAT", format version (u16), entry count (u32)
+    entries: source file name (64s), content hash prefix (10s), mode (4s), width (u16), height (u16),
+             pixel offset (u64) - one per portrait
+    pixels:  raw, uncompressed pixel rows of each portrait
+
+The atlas is built with the thumbnails (see thumbnail_cache.py). Opening
+maps the file once, and each portrait is sliced straight out of the mapping
+without opening, stat-ing or decoding a file. Processes that map the same
+atlas share its pages in the page cache.
+'''
+
+import mmap
+import os
+import struct
+
+try:
+    from PIL import Image
+except ImportError:
+    pass  # Callers check portraits.PIL_AVAILABLE first
+
+ATLAS_MAGIC = b"IDAT"
+ATLAS_VERSION = 1
+HASH_PREFIX_BYTES = 10
+
+ATLAS_HEADER = struct.Struct("<4sHI")
+ATLAS_ENTRY = struct.Struct(f"<64s{HASH_PREFIX_BYTES}s4sHHQ")
+
+ATLAS_MODES = ("L", "RGB", "RGBA")  # Raw modes with one byte per band
+
+
+def atlas_path(cache_dir: str, size_label: str) -> str:
+    '''Returns the atlas file for one display size, e.g. .thumbnails/atlas_150x150.bin.'''
+    return os.path.join(cache_dir, f"atlas_{size_label}.bin")
+
+
+def encode_atlas(sprites) -> bytes:
+    '''
+    Packs portraits into the atlas format.
+
+    Parameters:
+        sprites (Iterable[tuple[str, str, Image.Image]]): (source file name, sha256 hex digest, image).
+
+    Returns:
+        bytes: The encoded atlas file contents.
+    '''
+    sprites = list(sprites)
+    offset = ATLAS_HEADER.size + len(sprites) * ATLAS_ENTRY.size
+    entries = []
+    pixels = []
+
+    for name, digest, img in sprites:
+        if img.mode not in ATLAS_MODES:
+            img = img.convert("RGBA" if "A" in img.getbands() else "RGB")
+        data = img.tobytes()
+        entries.append(ATLAS_ENTRY.pack(name.encode("utf-8"), bytes.fromhex(digest)[:HASH_PREFIX_BYTES],
+                                        img.mode.encode("ascii"), img.width, img.height, offset))
+        pixels.append(data)
+        offset += len(data)
+
+    return ATLAS_HEADER.pack(ATLAS_MAGIC, ATLAS_VERSION, len(sprites)) + b"".join(entries) + b"".join(pixels)
+
+
+class SpriteAtlas:
+    '''
+    A read-only, memory-mapped atlas of portraits at one display size.
+    '''
+
+    def __init__(self, path: str) -> None:
+        '''
+        Maps an atlas file and reads its index.
+
+        Parameters:
+            path (str): The atlas file.
+        '''
+        self.path = path
+        self.entries = {}
+
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+
+        try:
+            if len(self._map) < ATLAS_HEADER.size:
+                raise ValueError("Sprite atlas corrupted: header too short")
+            magic, version, count = ATLAS_HEADER.unpack_from(self._map)
+            if magic != ATLAS_MAGIC:
+                raise ValueError("Sprite atlas corrupted: invalid format")
+            if version != ATLAS_VERSION:
+                raise ValueError(f"Unsupported sprite atlas version: {version}")
+
+            for i in range(count):
+                raw_name, digest, raw_mode, width, height, offset = ATLAS_ENTRY.unpack_from(
+                    self._map, ATLAS_HEADER.size + i * ATLAS_ENTRY.size)
+                mode = raw_mode.rstrip(b"\0").decode("ascii")
+                if offset + width * height * len(mode) > len(self._map):
+                    raise ValueError("Sprite atlas corrupted: insufficient data")
+                self.entries[raw_name.rstrip(b"\0").decode("utf-8")] = (digest, mode, width, height, offset)
+        except (ValueError, struct.error):
+            self.close()
+            raise
+
+    def get(self, name: str, digest: str | None = None) -> "Image.Image | None":
+        '''
+        Returns one portrait as an image backed directly by the mapping.
+
+        Parameters:
+            name (str): Source file name, e.g. "amy.jpg".
+            digest (str | None): Current sha256 hex digest of the source; a portrait
+                rendered from different contents is treated as missing.
+
+        Returns:
+            Image.Image | None: The portrait, or None if the atlas has no current copy.
+        '''
+        entry = self.entries.get(name)
+        if entry is None:
+            return None
+
+        stored_digest, mode, width, height, offset = entry
+        if digest is not None and bytes.fromhex(digest)[:HASH_PREFIX_BYTES] != stored_digest:
+            return None
+
+        end = offset + width * height * len(mode)
+        return Image.frombuffer(mode, (width, height), self._view[offset:end], "raw", mode, 0, 1)
+
+    def close(self) -> None:
+        '''Releases the mapping (images returned by get must no longer be used).'''
+        if self._map is not None:
+            try:
+                self._view.release()
+                self._map.close()
+            except BufferError:
+                pass  # Images from get still use the mapping; it is freed along with them
+            self._map = None
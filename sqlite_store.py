@@ -0,0 +1,185 @@
+'''
+SQLiteStorage Class - Multi-player save backend in one SQLite database with pooled connections
+
+Schema:
+    players: player_id (primary key), coins, total_draws
+    idols:   player_id, name, rarity, level, fans - primary key (player_id, name),
+             plus an index on name for cross-player queries
+
+A Player uses this backend instead of its text save file after
+Player.use_storage(storage, player_id); the text file stays the default.
+'''
+
+import queue
+import sqlite3
+from contextlib import contextmanager
+
+from idol_card import IdolCard
+from config import SQLITE_POOL_SIZE
+
+SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS players ("
+    " player_id TEXT PRIMARY KEY,"
+    " coins INTEGER NOT NULL,"
+    " total_draws INTEGER NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS idols ("
+    " player_id TEXT NOT NULL REFERENCES players(player_id) ON DELETE CASCADE,"
+    " name TEXT NOT NULL,"
+    " rarity TEXT NOT NULL,"
+    " level INTEGER NOT NULL,"
+    " fans INTEGER NOT NULL,"
+    " PRIMARY KEY (player_id, name)) WITHOUT ROWID",
+    "CREATE INDEX IF NOT EXISTS idols_by_name ON idols (name, player_id)",
+)
+
+# Statements are fixed strings with placeholders, so each pooled connection
+# compiles them once and reuses the prepared statement from its cache
+UPSERT_PLAYER = (
+    "INSERT INTO players (player_id, coins, total_draws) VALUES (?, ?, ?) "
+    "ON CONFLICT (player_id) DO UPDATE SET coins = excluded.coins, total_draws = excluded.total_draws"
+)
+DELETE_IDOLS = "DELETE FROM idols WHERE player_id = ?"
+INSERT_IDOL = "INSERT INTO idols (player_id, name, rarity, level, fans) VALUES (?, ?, ?, ?, ?)"
+SELECT_PLAYER = "SELECT coins, total_draws FROM players WHERE player_id = ?"
+SELECT_IDOLS = "SELECT name, rarity, level, fans FROM idols WHERE player_id = ?"
+SELECT_PLAYER_IDS = "SELECT player_id FROM players ORDER BY player_id"
+SELECT_OWNERS = "SELECT player_id FROM idols WHERE name = ? ORDER BY player_id"
+DELETE_PLAYER = "DELETE FROM players WHERE player_id = ?"
+
+
+class SQLiteStorage:
+    '''
+    Stores many players and their collections in one SQLite database.
+
+    Connections are opened up front and handed out from a small pool, so
+    threads can load and save different players concurrently. Every save
+    runs in a single transaction; save_players batches many players into one.
+    '''
+
+    def __init__(self, path: str, pool_size: int = SQLITE_POOL_SIZE) -> None:
+        '''
+        Opens the database, creating the schema if needed.
+
+        Parameters:
+            path (str): Database file path (":memory:" is not shared across pooled connections).
+            pool_size (int): Number of pooled connections. Defaults to config value.
+        '''
+        self.path = path
+        self._pool = queue.Queue()
+        self._connections = []
+
+        for _ in range(pool_size):
+            conn = sqlite3.connect(path, timeout=30, check_same_thread=False,
+                                   isolation_level=None, cached_statements=64)
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.execute("PRAGMA foreign_keys = ON")
+            self._connections.append(conn)
+            self._pool.put(conn)
+
+        with self._transaction() as conn:
+            for statement in SCHEMA:
+                conn.execute(statement)
+
+    @contextmanager
+    def _connection(self):
+        '''Borrows a connection from the pool for the duration of the block.'''
+        conn = self._pool.get()
+        try:
+            yield conn
+        finally:
+            self._pool.put(conn)
+
+    @contextmanager
+    def _transaction(self, write: bool = True):
+        '''
+        Borrows a connection and runs the block in one transaction, rolled back on error.
+
+        Parameters:
+            write (bool): If True, take the write lock up front; if False, the block only
+                reads, from one consistent snapshot. Defaults to True.
+        '''
+        with self._connection() as conn:
+            conn.execute("BEGIN IMMEDIATE" if write else "BEGIN")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    @staticmethod
+    def _write_player(conn: sqlite3.Connection, player_id: str, coins: int, total_draws: int, idols) -> None:
+        '''Replaces one player's row and collection inside the caller's transaction.'''
+        conn.execute(UPSERT_PLAYER, (player_id, coins, total_draws))
+        conn.execute(DELETE_IDOLS, (player_id,))
+        conn.executemany(INSERT_IDOL, (
+            (player_id, idol.name, idol.rarity, idol.level, idol.fans) for idol in idols
+        ))
+
+    def save_player(self, player_id: str, coins: int, total_draws: int, idols) -> None:
+        '''
+        Saves one player in a single transaction.
+
+        Parameters:
+            player_id (str): The player's id.
+            coins (int): Coin balance.
+            total_draws (int): Total cards drawn.
+            idols (Iterable[IdolCard]): Owned idols.
+        '''
+        with self._transaction() as conn:
+            self._write_player(conn, player_id, coins, total_draws, idols)
+
+    def save_players(self, players) -> None:
+        '''
+        Saves many players in one transaction.
+
+        Parameters:
+            players (Iterable[tuple[str, Player]]): (player_id, player) pairs.
+        '''
+        with self._transaction() as conn:
+            for player_id, player in players:
+                self._write_player(conn, player_id, player.coins, player.total_draws,
+                                   player.collection.values())
+
+    def load_player(self, player_id: str) -> tuple[int, int, list[IdolCard]] | None:
+        '''
+        Loads one player.
+
+        Parameters:
+            player_id (str): The player's id.
+
+        Returns:
+            tuple[int, int, list[IdolCard]] | None: Coins, total draws and owned idols, or None if not stored.
+        '''
+        # Both reads see the same snapshot, so a concurrent save cannot land in between
+        with self._transaction(write=False) as conn:
+            row = conn.execute(SELECT_PLAYER, (player_id,)).fetchone()
+            if row is None:
+                return None
+            idols = [IdolCard(name, rarity, level, fans)
+                     for name, rarity, level, fans in conn.execute(SELECT_IDOLS, (player_id,))]
+
+        coins, total_draws = row
+        return (coins, total_draws, idols)
+
+    def player_ids(self) -> list[str]:
+        '''Returns the ids of all stored players in sorted order.'''
+        with self._connection() as conn:
+            return [player_id for (player_id,) in conn.execute(SELECT_PLAYER_IDS)]
+
+    def owners_of(self, name: str) -> list[str]:
+        '''Returns the ids of all players who own an idol, using the index on idol name.'''
+        with self._connection() as conn:
+            return [player_id for (player_id,) in conn.execute(SELECT_OWNERS, (name,))]
+
+    def delete_player(self, player_id: str) -> None:
+        '''Removes a player and their collection.'''
+        with self._transaction() as conn:
+            conn.execute(DELETE_PLAYER, (player_id,))
+
+    def close(self) -> None:
+        '''Closes every pooled connection.'''
+        for conn in self._connections:
+            conn.close()
+        self._connections = []
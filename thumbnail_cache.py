@@ -0,0 +1,213 @@
+'''
+Thumbnail Cache - Pre-rendered portraits at every GUI display size, invalidated when sources change
+
+The build step renders each portrait in IMAGES_DIR at every size in
+PORTRAIT_SIZES into THUMBNAIL_DIR, plus one sprite atlas per size holding
+all of them (see sprite_atlas.py). Thumbnails are named by the source's
+content hash, and a manifest records each source's mtime, byte size and
+hash, so a lookup costs one stat of the source. A source that changed
+since the last build has no thumbnail until the next build, and the GUI
+falls back to decoding the original.
+
+HOW TO RUN (after adding or changing portraits):
+    python thumbnail_cache.py
+    python thumbnail_cache.py --quality balanced
+'''
+
+import argparse
+import hashlib
+import io
+import json
+import os
+
+from portraits import PIL_AVAILABLE, decode_portrait
+from save_manager import atomic_write
+from sprite_atlas import atlas_path, encode_atlas
+from config import IMAGES_DIR, THUMBNAIL_DIR, PORTRAIT_SIZES, PORTRAIT_RESAMPLE
+
+MANIFEST_NAME = "manifest.json"
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg")
+
+
+def size_label(size: tuple[int, int]) -> str:
+    '''Returns a display size as used in thumbnail file names, e.g. "150x150".'''
+    return f"{size[0]}x{size[1]}"
+
+
+def file_digest(path: str) -> str:
+    '''Returns the SHA-256 hex digest of a file's contents.'''
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ThumbnailCache:
+    '''
+    Looks up and builds pre-rendered portrait thumbnails.
+
+    The manifest maps each source file name to its mtime_ns, byte size,
+    sha256 and the sizes rendered for it.
+    '''
+
+    def __init__(self, images_dir: str = IMAGES_DIR, cache_dir: str = THUMBNAIL_DIR) -> None:
+        '''
+        Opens the cache and reads its manifest if one has been built.
+
+        Parameters:
+            images_dir (str): Directory of original portraits. Defaults to config value.
+            cache_dir (str): Directory of thumbnails and the manifest. Defaults to config value.
+        '''
+        self.images_dir = images_dir
+        self.cache_dir = cache_dir
+        self.manifest_path = os.path.join(cache_dir, MANIFEST_NAME)
+        self.sources = {}
+
+        try:
+            with open(self.manifest_path, 'r') as f:
+                self.sources = json.load(f)
+        except (OSError, ValueError):
+            pass  # Not built yet (or unreadable): every lookup falls back to the originals
+
+    def thumbnail_path(self, digest: str, size: tuple[int, int]) -> str:
+        '''Returns where the thumbnail of a source with this content hash is stored for a size.'''
+        return os.path.join(self.cache_dir, f"{digest[:20]}_{size_label(size)}.png")
+
+    def atlas_path(self, size: tuple[int, int]) -> str:
+        '''Returns where the sprite atlas for a display size is stored.'''
+        return atlas_path(self.cache_dir, size_label(size))
+
+    def current_digest(self, source_path: str, size: tuple[int, int], sha256: str | None = None) -> str | None:
+        '''
+        Returns a portrait's content hash from the manifest if its thumbnails are up to date.
+
+        Parameters:
+            source_path (str): Path of the original portrait in images_dir.
+            size (tuple[int, int]): Display size (width, height).
+            sha256 (str | None): The source's current hash if already known (e.g. from an AssetIndex),
+                which saves stat-ing the source. An AssetIndex only notices a portrait overwritten
+                in place once the images directory's mtime changes (touch it) or on a rebuild.
+
+        Returns:
+            str | None: sha256 hex digest, or None if the source changed or was never built at this size.
+        '''
+        entry = self.sources.get(os.path.basename(source_path))
+        if entry is None or size_label(size) not in entry["sizes"]:
+            return None
+        if sha256 is not None:
+            return entry["sha256"] if sha256 == entry["sha256"] else None
+
+        try:
+            stat = os.stat(source_path)
+        except OSError:
+            return None
+        if stat.st_mtime_ns != entry["mtime_ns"] or stat.st_size != entry["bytes"]:
+            return None
+        return entry["sha256"]
+
+    def lookup(self, source_path: str, size: tuple[int, int]) -> str | None:
+        '''
+        Returns the thumbnail for a portrait if it is up to date.
+
+        Parameters:
+            source_path (str): Path of the original portrait in images_dir.
+            size (tuple[int, int]): Display size (width, height).
+
+        Returns:
+            str | None: Thumbnail path, or None if the source changed or was never built at this size.
+        '''
+        digest = self.current_digest(source_path, size)
+        if digest is None:
+            return None
+        return self.thumbnail_path(digest, size)
+
+    def build(self, sizes: list[tuple[int, int]] = PORTRAIT_SIZES, quality: str = PORTRAIT_RESAMPLE,
+              force: bool = False) -> int:
+        '''
+        Renders missing or stale thumbnails, rewrites the sprite atlases and the manifest.
+
+        A source whose mtime changed is re-hashed; if its contents are the
+        same, its thumbnails are reused. Thumbnails no longer referenced are deleted.
+
+        Parameters:
+            sizes (list[tuple[int, int]]): Display sizes to render. Defaults to config value.
+            quality (str): Resample tier (see portraits.py). Defaults to config value.
+            force (bool): If True, re-render everything. Defaults to False.
+
+        Returns:
+            int: Number of thumbnails rendered.
+        '''
+        if not PIL_AVAILABLE:
+            raise RuntimeError("PIL is required to build portrait thumbnails")
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        labels = [size_label(size) for size in sizes]
+        sources = {}
+        rendered = 0
+
+        for name in sorted(os.listdir(self.images_dir)):
+            if not name.lower().endswith(IMAGE_EXTENSIONS):
+                continue
+            path = os.path.join(self.images_dir, name)
+            stat = os.stat(path)
+            entry = self.sources.get(name)
+
+            unchanged = (entry is not None and stat.st_mtime_ns == entry["mtime_ns"]
+                         and stat.st_size == entry["bytes"])
+            digest = entry["sha256"] if unchanged else file_digest(path)
+
+            for size in sizes:
+                thumbnail = self.thumbnail_path(digest, size)
+                if not force and os.path.exists(thumbnail):
+                    continue
+                buffer = io.BytesIO()
+                decode_portrait(path, size, quality).save(buffer, format="PNG")
+                atomic_write(thumbnail, buffer.getvalue())
+                rendered += 1
+
+            sources[name] = {
+                "mtime_ns": stat.st_mtime_ns,
+                "bytes": stat.st_size,
+                "sha256": digest,
+                "sizes": labels,
+            }
+
+        # One atlas per size, packed from the finished thumbnails
+        for size in sizes:
+            sprites = []
+            for name, entry in sources.items():
+                thumbnail = self.thumbnail_path(entry["sha256"], size)
+                sprites.append((name, entry["sha256"], decode_portrait(thumbnail, size)))
+            atomic_write(self.atlas_path(size), encode_atlas(sprites))
+
+        # Remove thumbnails of deleted or changed portraits and of dropped sizes
+        keep = {os.path.basename(self.thumbnail_path(entry["sha256"], size))
+                for entry in sources.values() for size in sizes}
+        keep.update(os.path.basename(self.atlas_path(size)) for size in sizes)
+        for name in os.listdir(self.cache_dir):
+            if name.endswith((".png", ".bin")) and name not in keep:
+                os.remove(os.path.join(self.cache_dir, name))
+
+        self.sources = sources
+        atomic_write(self.manifest_path, json.dumps(sources, indent=1, sort_keys=True).encode("utf-8"))
+        return rendered
+
+
+def main() -> None:
+    '''Command-line entry point for the thumbnail build step.'''
+    parser = argparse.ArgumentParser(description="Pre-render idol portraits at every GUI display size.")
+    parser.add_argument("--images", default=IMAGES_DIR, help="directory of original portraits")
+    parser.add_argument("--cache", default=THUMBNAIL_DIR, help="directory for thumbnails and the manifest")
+    parser.add_argument("--quality", default=PORTRAIT_RESAMPLE, choices=["fast", "balanced", "high"],
+                        help="resample quality")
+    parser.add_argument("--force", action="store_true", help="re-render every thumbnail")
+    args = parser.parse_args()
+
+    cache = ThumbnailCache(args.images, args.cache)
+    rendered = cache.build(quality=args.quality, force=args.force)
+    print(f"Rendered {rendered} thumbnails for {len(cache.sources)} portraits into {args.cache}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+'''
+VirtualList Class - Scrollable Tkinter list that only creates widgets for the visible rows
+'''
+
+import tkinter as tk
+
+
+class VirtualList(tk.Frame):
+    '''
+    A scrollable list of text rows that stays fast for thousands of items.
+
+    Only enough Label widgets to fill the visible area are created. While
+    scrolling they are moved and re-labelled for whichever items come into
+    view, so opening the list and scrolling cost O(visible rows) instead of
+    O(items). The scroll region is set once per item list rather than on
+    every <Configure>.
+    '''
+
+    def __init__(self, parent: tk.Widget, items: list, render, row_height: int = 26,
+                 bg: str = "white", font: tuple = ("Arial", 11)) -> None:
+        '''
+        Creates the list inside a parent widget.
+
+        Parameters:
+            parent (tk.Widget): Container for the list.
+            items (list): Items to show, already in display order.
+            render (Callable[[int, object], str]): Returns the text for (item index, item).
+            row_height (int): Height of every row in pixels. Defaults to 26.
+            bg (str): Background colour. Defaults to "white".
+            font (tuple): Row font. Defaults to ("Arial", 11).
+        '''
+        super().__init__(parent, bg=bg)
+        self.items = items
+        self.render = render
+        self.row_height = row_height
+        self.bg = bg
+        self.font = font
+
+        self.canvas = tk.Canvas(self, bg=bg, highlightthickness=0)
+        self.scrollbar = tk.Scrollbar(self, orient="vertical", command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self._on_scroll)
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
+
+        self.rows = []  # Recycled (label, canvas window id) pairs
+        self.canvas.bind("<Configure>", self._on_resize)
+        self.set_items(items)
+
+    def set_items(self, items: list) -> None:
+        '''Replaces the items shown and scrolls back to the top.'''
+        self.items = items
+        self.canvas.configure(scrollregion=(0, 0, self.canvas.winfo_width(), len(items) * self.row_height))
+        self.canvas.yview_moveto(0)
+        self._refresh()
+
+    def _on_scroll(self, first: str, last: str) -> None:
+        '''Keeps the scrollbar in sync and re-labels the rows for the new position.'''
+        self.scrollbar.set(first, last)
+        self._refresh()
+
+    def _on_resize(self, event: tk.Event) -> None:
+        '''Grows or shrinks the row pool to the new height and stretches rows to the new width.'''
+        self.canvas.configure(scrollregion=(0, 0, event.width, len(self.items) * self.row_height))
+
+        needed = event.height // self.row_height + 2
+        while len(self.rows) < needed:
+            label = tk.Label(self.canvas, font=self.font, bg=self.bg, anchor="w", padx=10)
+            window = self.canvas.create_window(0, 0, window=label, anchor="nw",
+                                               height=self.row_height, state="hidden")
+            self.rows.append((label, window))
+        while len(self.rows) > needed:
+            label, window = self.rows.pop()
+            self.canvas.delete(window)
+            label.destroy()
+
+        for _, window in self.rows:
+            self.canvas.itemconfigure(window, width=event.width)
+        self._refresh()
+
+    def _refresh(self) -> None:
+        '''Moves each pooled row to the item it should show at the current scroll position.'''
+        top = int(self.canvas.canvasy(0))
+        first = max(0, top // self.row_height)
+
+        for offset, (label, window) in enumerate(self.rows):
+            index = first + offset
+            if index >= len(self.items):
+                self.canvas.itemconfigure(window, state="hidden")
+                continue
+            label.configure(text=self.render(index, self.items[index]))
+            self.canvas.coords(window, 0, index * self.row_height)
+            self.canvas.itemconfigure(window, state="normal")